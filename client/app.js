@@ -226,7 +226,7 @@ document.addEventListener('DOMContentLoaded', () => {
   async function loadUser() {
     logger.info('Loading user data...');
     try {
-      const resp = await fetch('/api/user', {
+      const resp = await fetch('/api/user?include=scores', {
         method: 'GET',
         headers: { Authorization: 'Bearer ' + authToken }
       });
@@ -523,6 +523,35 @@ document.addEventListener('DOMContentLoaded', () => {
     });
   }
 
+  function showScores(data) {
+    renderScoreboard(
+      data.scoreboard || [],
+      data.familyTotal || 0,
+      data.familyWeeklyTotal || 0
+    );
+    headerTotalPoints.textContent =
+      data.scoreboard?.find((row) => row.userId === currentUser?.userId)
+        ?.totalPoints || headerTotalPoints.textContent;
+  }
+
+  async function loadScores() {
+    try {
+      const resp = await fetch('/api/scores', {
+        method: 'GET',
+        headers: { Authorization: 'Bearer ' + authToken }
+      });
+      const data = await resp.json();
+      if (!resp.ok) {
+        logger.error('Scores load failed:', data.error);
+        return;
+      }
+      logger.info(`Scores loaded, family total: ${data.familyTotal}`);
+      showScores(data);
+    } catch (err) {
+      logger.error('Scores network error:', err);
+    }
+  }
+
   async function recordEvent(type, sourceButton) {
     logger.info(`Recording event: ${type}`);
     try {
@@ -537,15 +566,13 @@ document.addEventListener('DOMContentLoaded', () => {
       const data = await resp.json();
       logger.debug('Event response:', data);
       if (resp.ok) {
-        logger.info(`Event ${type} recorded successfully, new family total: ${data.familyTotal}`);
-        renderScoreboard(
-          data.scoreboard || [],
-          data.familyTotal || 0,
-          data.familyWeeklyTotal || 0
-        );
-        headerTotalPoints.textContent =
-          data.scoreboard?.find((row) => row.userId === currentUser?.userId)
-            ?.totalPoints || headerTotalPoints.textContent;
+        logger.info(`Event ${type} recorded successfully`);
+        if (data.scoreboard) {
+          showScores(data);
+        } else {
+          // the server only acknowledges the event; fetch the new totals
+          await loadScores();
+        }
         const reminderKind = sourceButton?.getAttribute('data-reminder');
         if (reminderKind === 'treat') {
           showReminder('קחו חטיפים לפני שיוצאים לטיול 🦴');
@@ -628,11 +655,6 @@ document.addEventListener('DOMContentLoaded', () => {
             : '';
         dogPhotoInput.value = data.dogPhotoUrl || '';
         updateDogAgeText();
-        renderScoreboard(
-          data.scoreboard || [],
-          data.familyTotal || 0,
-          data.familyWeeklyTotal || 0
-        );
         dogEditSection.classList.add('hidden');
       } else {
         alert(data.error || 'שגיאה בעדכון השם.');
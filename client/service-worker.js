@@ -2,7 +2,7 @@
 
 // Bump the cache name whenever we change core assets like app.js
 // so that users always get the latest frontend code.
-const CACHE_NAME = 'shih-tzu-app-v17';
+const CACHE_NAME = 'shih-tzu-app-v19';
 const ASSETS = [
   '/',
   '/index.html',
@@ -1,10 +1,28 @@
 import json
+import os
 import datetime
+from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
 
 # Load database
 with open('db.json', encoding='utf-8') as f:
     db = json.load(f)
 
+# Apply events the server has appended to its log since the last compaction
+if os.path.exists('db.events.ndjson'):
+    deleted = set()
+    with open('db.events.ndjson', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if '_del' in record:
+                deleted.add(record['_del'])
+            else:
+                db['events'].append(record)
+    db['events'] = [e for e in db['events'] if e['id'] not in deleted]
+
 print("=" * 60)
 print("DATABASE EVENT ANALYSIS")
 print("=" * 60)
@@ -18,7 +36,7 @@ print(f"Today start: {today_start}")
 print(f"Today timestamp: {int(today_start.timestamp())}")
 
 # Show recent events
-events = sorted(db['events'], key=lambda e: e['timestamp'], reverse=True)[:20]
+events = nlargest(20, db['events'], key=itemgetter('timestamp'))
 
 print(f"\n20 Most Recent Events:")
 print("-" * 60)
@@ -30,13 +48,15 @@ for ev in events:
     today_marker = " <-- TODAY" if is_today else ""
     print(f"{date_str} - {ev['type']:15} by userId {ev['userId'][:8]}... {today_marker}")
 
-# Count today's events
-today_events = [e for e in db['events'] if datetime.datetime.fromtimestamp(e['timestamp']).date() == now.date()]
-print(f"\nTotal events today: {len(today_events)}")
+# Count and group today's events in one pass, comparing local day numbers
+utc_offset = now.astimezone().utcoffset().total_seconds()
+today_day = (now.timestamp() + utc_offset) // 86400
+today_types = Counter()
+for e in db['events']:
+    if (e['timestamp'] + utc_offset) // 86400 == today_day:
+        today_types[e['type']] += 1
+print(f"\nTotal events today: {sum(today_types.values())}")
 
-# Group by type
-from collections import Counter
-today_types = Counter(e['type'] for e in today_events)
 print("\nToday's events by type:")
 for event_type, count in today_types.most_common():
     print(f"  {event_type}: {count}")
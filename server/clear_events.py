@@ -2,12 +2,15 @@
 """Clear all events in db.json (with backup).
 
 Creates a backup named db.json.reset.bak.<timestamp> and replaces the
-events array with an empty list. Run from the `server` directory.
+events array with an empty list. The server's events log
+(db.events.ndjson) is removed as well so the events are not replayed.
+Run from the `server` directory.
 """
 import json, os, shutil, datetime
 
 HERE = os.path.dirname(__file__)
 DB = os.path.join(HERE, 'db.json')
+EVENTS_LOG = os.path.join(HERE, 'db.events.ndjson')
 
 def main():
     if not os.path.exists(DB):
@@ -24,6 +27,8 @@ def main():
     with open(tmp, 'w', encoding='utf-8') as fh:
         json.dump(db, fh, ensure_ascii=False, indent=2)
     os.replace(tmp, DB)
+    if os.path.exists(EVENTS_LOG):
+        os.remove(EVENTS_LOG)
     print('Cleared all events in', DB)
 
 if __name__ == '__main__':
@@ -8,19 +8,19 @@ def pytest_addoption(parser):
 	return
 
 
-def server_module_factory(tmp_path):
+def server_module_factory(tmp_path, source=None):
 	repo_dir = Path(__file__).parent
-	orig_db = repo_dir / 'db.json'
+	orig_db = source or repo_dir / 'db.json'
 	tmp_db = tmp_path / 'db.json'
 	shutil.copy(orig_db, tmp_db)
 
 	srv = importlib.import_module('server')
-	# patch server module to use tmp db
+	# reload for fresh module state, then patch it to use the tmp db (a reload
+	# afterwards would reset DATA_FILE to the real db.json)
+	importlib.reload(srv)
 	srv.DATA_FILE = str(tmp_db)
 	srv._db_cache = None
 	srv._db_cache_mtime = None
-	# reload to ensure it picks up changes
-	importlib.reload(srv)
 	return srv
 
 
@@ -28,8 +28,73 @@ import pytest
 
 
 @pytest.fixture
-def server_module(tmp_path):
-	return server_module_factory(tmp_path)
+def server_module(tmp_path, db_template):
+	return server_module_factory(tmp_path, db_template)
+
+
+@pytest.fixture(scope='session')
+def db_template(tmp_path_factory):
+	# copied once per session; tests copy this file rather than re-encoding JSON
+	path = tmp_path_factory.mktemp('db') / 'db.json'
+	shutil.copy(Path(__file__).parent / 'db.json', path)
+	return path
+
+
+@pytest.fixture
+def server_db(tmp_path, monkeypatch):
+	"""Point the imported server module at an empty db.json for one test,
+	with fresh cache, pending-save and events-log state."""
+	import server
+	path = tmp_path / 'db.json'
+	path.write_text('{"households": [], "users": [], "events": []}', encoding='utf-8')
+	monkeypatch.setattr(server, 'DATA_FILE', str(path))
+	for name in ('_db_cache', '_db_cache_mtime', '_dirty_db', '_save_timer',
+			'_events_log_fd', '_events_log_fd_path'):
+		monkeypatch.setattr(server, name, None)
+	for name in ('_dirty_count', '_events_log_offset', '_events_log_appends'):
+		monkeypatch.setattr(server, name, 0)
+	yield path
+	# before monkeypatch puts the old values back
+	if server._save_timer is not None:
+		server._save_timer.cancel()
+	server._close_events_log()
+
+
+def _isolate_flask_server(monkeypatch, path):
+	"""Point flask_server at ``path`` with empty cache, buffer and log state,
+	and no background log writer (tests flush explicitly or via load_db)."""
+	import flask_server
+	writer = flask_server._log_writer
+	monkeypatch.setattr(flask_server, '_log_writer', None)
+	monkeypatch.setattr(flask_server, '_start_log_writer', lambda: None)
+	if writer is not None:
+		# it stops on its next wake-up, before the state below is swapped
+		writer.join()
+	monkeypatch.setattr(flask_server, 'DATA_FILE', str(path))
+	for name in ('_db_cache', '_db_cache_mtime', '_pending_log_path'):
+		monkeypatch.setattr(flask_server, name, None)
+	monkeypatch.setattr(flask_server, '_pending_log_lines', [])
+	monkeypatch.setattr(flask_server, '_pending_log_since', 0.0)
+	for name in ('_events_log_offset', '_events_log_appends'):
+		monkeypatch.setattr(flask_server, name, 0)
+
+
+@pytest.fixture
+def flask_db(tmp_path, monkeypatch, db_template):
+	"""Point flask_server at a private copy of db.json for one test."""
+	path = tmp_path / 'db.json'
+	shutil.copy(db_template, path)
+	_isolate_flask_server(monkeypatch, path)
+	return path
+
+
+@pytest.fixture
+def flask_empty_db(tmp_path, monkeypatch):
+	"""Point flask_server at an empty db.json for one test."""
+	path = tmp_path / 'db.json'
+	path.write_text('{"households": [], "users": [], "events": []}', encoding='utf-8')
+	_isolate_flask_server(monkeypatch, path)
+	return path
 
 
 # Ignore legacy test scripts that aren't pytest-compatible
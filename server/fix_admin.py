@@ -3,6 +3,7 @@
 
 import json
 import os
+from collections import defaultdict
 
 def fix_admin_status():
     """Make the first user in each household an admin"""
@@ -15,12 +16,16 @@ def fix_admin_status():
     print("Fixing admin status...")
     print(f"Households: {len(db['households'])}, Users: {len(db['users'])}")
     
+    # Group users by household in one pass
+    users_by_household = defaultdict(list)
+    for u in db['users']:
+        users_by_household[u['householdId']].append(u)
+    
     # For each household, make the first user an admin if no admin exists
     for h in db['households']:
-        household_users = [u for u in db['users'] if u['householdId'] == h['id']]
-        admins = [u for u in household_users if u.get('isAdmin')]
+        household_users = users_by_household.get(h['id'], [])
         
-        if len(admins) == 0 and len(household_users) > 0:
+        if household_users and not any(u.get('isAdmin') for u in household_users):
             # Make first user admin
             first_user = household_users[0]
             first_user['isAdmin'] = True
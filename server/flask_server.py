@@ -5,13 +5,27 @@ Compatible with both local development and PythonAnywhere deployment.
 Maintains exact same behavior as the original HTTP server.
 """
 from flask import Flask, request, jsonify, send_from_directory, make_response
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-import json
+import orjson
 import os
 import uuid
+import secrets
+import atexit
 import datetime
+import time
 import logging
+import mmap
 import sys
+import threading
+from collections import Counter
+from functools import wraps
+from itertools import count, islice
+
+# Resolve paths
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+# Where db.json and server.log live; wsgi.py sets this instead of chdir-ing
+APP_HOME = os.environ.get('DOG_APP_HOME') or SCRIPT_DIR
 
 # Setup logging
 logging.basicConfig(
@@ -19,15 +33,13 @@ logging.basicConfig(
     format='%(asctime)s [%(levelname)s] %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler('server.log', encoding='utf-8')
+        logging.FileHandler(os.path.join(APP_HOME, 'server.log'), encoding='utf-8')
     ]
 )
 logger = logging.getLogger(__name__)
 
-# Resolve paths
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 # Allow overriding the data file. Prefer `DB_FILE`, fall back to `TEST_DB_FILE` for tests.
-DATA_FILE = os.environ.get('DB_FILE') or os.environ.get('TEST_DB_FILE') or os.path.join(SCRIPT_DIR, 'db.json')
+DATA_FILE = os.environ.get('DB_FILE') or os.environ.get('TEST_DB_FILE') or os.path.join(APP_HOME, 'db.json')
 # Absolute path to client directory (sibling `client` folder)
 CLIENT_DIR = os.path.abspath(os.path.join(SCRIPT_DIR, '..', 'client'))
 
@@ -37,182 +49,722 @@ logger.info(f"Data file: {DATA_FILE}")
 logger.info(f"Client directory: {CLIENT_DIR}")
 logger.info(f"Client directory exists: {os.path.exists(CLIENT_DIR)}")
 
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, for jsonify and request.get_json."""
+
+    def dumps(self, obj, **kwargs):
+        # DefaultJSONProvider.default still covers types orjson lacks (Decimal, __html__)
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Flask app with absolute client path
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 app.static_folder = CLIENT_DIR
 app.static_url_path = ''
 CORS(app, resources={r"/*": {"origins": "*"}})
 
+# New events are appended to a sidecar log instead of rewriting db.json on
+# every request; the log is folded back into db.json on every save_db and
+# after this many appends.
+EVENTS_LOG_COMPACT_EVERY = 500
+# Appended records are buffered in memory and written by a background thread
+# this often (seconds), so POSTs never wait on the disk. The in-memory db is
+# already authoritative; this is the durability window. Requests also flush
+# an overdue buffer themselves, for hosts where app threads don't run (uWSGI
+# without enable-threads).
+EVENTS_LOG_FLUSH_INTERVAL = 0.1
+
+# Event ids are a per-process random prefix plus a counter: unique across
+# workers and restarts without paying for uuid4() on every POST.
+_EVENT_ID_PREFIX = secrets.token_hex(4)
+_event_id_counter = count(int(time.time() * 1000))
+
 # Database cache to avoid reading from disk on every request
 _db_cache = None
 _db_cache_mtime = None
+_events_log_offset = 0  # bytes of the events log already applied to the cache
+_events_log_appends = 0  # records in the events log since the last compaction
+_pending_log_lines = []  # serialized records not yet written to the events log
+_pending_log_path = None  # log file those records belong to
+_pending_log_since = 0.0  # time.monotonic() when the oldest of them was queued
+_log_writer = None
+# Serialises cache/file access when served by a threaded or gevent worker
+_db_lock = threading.RLock()
+
+# Lookup indexes over the cached db (token/id -> record), rebuilt whenever a
+# different db object is seen or the db is saved
+_indexed_db = None
+_user_by_token = {}
+_user_by_id = {}
+_household_by_id = {}
+_users_by_household = {}
+_household_by_invite = {}  # invite token -> household
+_user_by_email = {}  # lowercased email -> user
+_users_by_username = {}  # lowercased username -> [users]
+
+# Events bucketed per household ({householdId: {eventId: event}}, in
+# insertion order). Kept in sync incrementally by add_event/remove_event.
+_events_indexed_db = None
+_events_by_household = {}
+
+# Per-household scoreboard state, updated incrementally as events are added
+# or deleted. Dropped wholesale when the db is reloaded or the day rolls over
+# (weekly points and streaks are relative to today).
+_scoreboard_db = None
+_scoreboard_day = None  # day index of "today" for the cached state
+_scoreboard_utc_offset = 0  # local UTC offset (seconds) used for day indexes
+_scoreboard_cache = {}
+
+# Per-household change counters behind the ETags on /api/scores and
+# /api/today. _db_generation moves whenever db.json is (re)loaded or saved,
+# which covers user/household edits; event changes bump the household.
+_household_version = Counter()
+_db_generation = 0
+
+
+def _events_log_path():
+    """Path of the append-only events log that sits next to DATA_FILE."""
+    return os.path.splitext(DATA_FILE)[0] + '.events.ndjson'
+
+
+def _events_log_size():
+    try:
+        return os.path.getsize(_events_log_path())
+    except OSError:
+        return 0
+
+
+def _replay_events_log(db, offset=0):
+    """Apply events-log records from byte ``offset`` onwards to ``db``.
+
+    Each line is either an event dict or a ``{"_del": id, "householdId": ...}``
+    tombstone. Events whose id is already present are skipped, so replaying a
+    log that was already folded into db.json (e.g. after a crash mid-compaction)
+    or records this process wrote itself is harmless.
+    Returns (new offset, records applied).
+    """
+    try:
+        fh = open(_events_log_path(), 'rb')
+    except FileNotFoundError:
+        return offset, 0
+    applied = 0
+    with fh:
+        fh.seek(offset)
+        for line in fh:
+            if not line.endswith(b'\n'):
+                break  # partially written record, pick it up on the next load
+            offset += len(line)
+            applied += 1
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                logger.error(f"Skipping corrupt events log record: {e}")
+                continue
+            if '_del' in record:
+                event = _find_logged_event(db, record)
+                if event is not None:
+                    _remove_event_in_memory(db, event)
+            elif get_household_event(db, record.get('householdId'), record.get('id')) is None:
+                _add_event_in_memory(db, record)
+    return offset, applied
+
+
+def _find_logged_event(db, tombstone):
+    """Return the event a tombstone refers to, or None if it is already gone."""
+    household_id = tombstone.get('householdId')
+    if household_id is not None:
+        return get_household_event(db, household_id, tombstone['_del'])
+    # Older tombstones carry only the id; look in every household's bucket
+    _ensure_event_index(db)
+    event_id = tombstone['_del']
+    return next((bucket[event_id] for bucket in _events_by_household.values()
+                 if event_id in bucket), None)
+
+
+def _read_json_file(path):
+    """Parse a JSON file straight from a read-only mmap, without copying it into a bytes object first."""
+    with open(path, 'rb') as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return orjson.loads(b'')  # raises JSONDecodeError; mmap can't map empty files
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
 
 
 def load_db():
     """Load the database from disk with caching. Creates an empty db if necessary."""
-    global _db_cache, _db_cache_mtime
-    
-    # Check if file exists
-    if not os.path.exists(DATA_FILE):
-        logger.warning(f"Database file not found at {DATA_FILE}, creating new")
-        _db_cache = {'households': [], 'users': [], 'events': []}
-        _db_cache_mtime = None
-        return _db_cache
-    
-    # Check if cache is still valid
-    current_mtime = os.path.getmtime(DATA_FILE)
-    if _db_cache is not None and _db_cache_mtime == current_mtime:
-        # Cache hit - return cached version
-        return _db_cache
-    
-    # Cache miss - load from disk
-    with open(DATA_FILE, 'r', encoding='utf-8') as fh:
+    global _db_cache, _db_cache_mtime, _events_log_offset, _events_log_appends, _db_generation
+    with _db_lock:
+        _flush_events_log_if_due()
+        # One stat answers both "does it exist" and "has it changed"
         try:
-            _db_cache = json.load(fh)
-            _db_cache_mtime = current_mtime
-            logger.debug(f"Database loaded from disk: {len(_db_cache.get('households', []))} households, {len(_db_cache.get('users', []))} users, {len(_db_cache.get('events', []))} events")
+            current_mtime = os.stat(DATA_FILE).st_mtime_ns
+        except FileNotFoundError:
+            flush_events_log()
+            logger.warning(f"Database file not found at {DATA_FILE}, creating new")
+            _db_cache = {'households': [], 'users': [], 'events': []}
+            _db_cache_mtime = None
+            _events_log_offset, _events_log_appends = _replay_events_log(_db_cache)
+            _db_generation += 1
             return _db_cache
-        except json.JSONDecodeError as e:
+
+        # Check if cache is still valid
+        if _db_cache is not None and _db_cache_mtime == current_mtime:
+            log_size = _events_log_size()
+            if log_size == _events_log_offset:
+                # Cache hit - return cached version
+                return _db_cache
+            if log_size > _events_log_offset:
+                # Only the events log grew (another worker appended): apply just
+                # the new records instead of re-parsing db.json. Our buffered
+                # records go to disk first so the log keeps their order.
+                flush_events_log()
+                _events_log_offset, applied = _replay_events_log(_db_cache, _events_log_offset)
+                _events_log_appends += applied
+                return _db_cache
+
+        # Cache miss - load from disk, after writing out anything still buffered
+        flush_events_log()
+        try:
+            _db_cache = _read_json_file(DATA_FILE)
+            _db_cache_mtime = current_mtime
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse database JSON: {e}")
             _db_cache = {'households': [], 'users': [], 'events': []}
             _db_cache_mtime = None
-            return _db_cache
+        _events_log_offset, _events_log_appends = _replay_events_log(_db_cache)
+        _db_generation += 1
+        logger.debug(f"Database loaded from disk: {len(_db_cache.get('households', []))} households, {len(_db_cache.get('users', []))} users, {len(_db_cache.get('events', []))} events")
+        return _db_cache
 
 
 def save_db(db):
-    """Persist the database to disk and update cache."""
-    global _db_cache, _db_cache_mtime
-    try:
-        tmp_file = DATA_FILE + '.tmp'
-        with open(tmp_file, 'w', encoding='utf-8') as fh:
-            json.dump(db, fh, indent=2, ensure_ascii=False)
-        os.replace(tmp_file, DATA_FILE)
-        # Update cache
-        _db_cache = db
-        _db_cache_mtime = os.path.getmtime(DATA_FILE)
-        logger.debug("Database saved successfully")
-    except Exception as e:
-        logger.error(f"Failed to save database: {e}")
-        # Invalidate cache on error
-        _db_cache = None
-        _db_cache_mtime = None
+    """Persist the full database to disk, fold in the events log and update cache."""
+    global _db_cache, _db_cache_mtime, _events_log_offset, _events_log_appends, _db_generation
+    with _db_lock:
+        try:
+            tmp_file = DATA_FILE + '.tmp'
+            with open(tmp_file, 'wb') as fh:
+                # compact, like server.py: half the bytes and orjson's fast path
+                fh.write(orjson.dumps(db))
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp_file, DATA_FILE)
+            # db.json now holds every event, so the log (and whatever was
+            # still buffered for it) can go
+            if os.path.exists(_events_log_path()):
+                os.remove(_events_log_path())
+            _pending_log_lines.clear()
+            _events_log_offset = 0
+            _events_log_appends = 0
+            # Update cache
+            _db_cache = db
+            _db_cache_mtime = os.stat(DATA_FILE).st_mtime_ns
+            _db_generation += 1
+            _rebuild_indexes(db)
+            logger.debug("Database saved successfully")
+        except Exception as e:
+            logger.error(f"Failed to save database: {e}")
+            # Invalidate cache on error
+            _db_cache = None
+            _db_cache_mtime = None
+
+
+def append_event_record(db, record):
+    """Queue one event (or ``{"_del": id}`` tombstone) for the events log.
+
+    ``db`` must already reflect the change; it is written out in full once
+    EVENTS_LOG_COMPACT_EVERY records have accumulated.
+    """
+    global _events_log_appends, _pending_log_path, _pending_log_since
+    with _db_lock:
+        path = _events_log_path()
+        if path != _pending_log_path:
+            flush_events_log()
+            _pending_log_path = path
+        if not _pending_log_lines:
+            _pending_log_since = time.monotonic()
+        _pending_log_lines.append(orjson.dumps(record) + b'\n')
+        _events_log_appends += 1
+        _start_log_writer()
+        _flush_events_log_if_due()
+        if _events_log_appends >= EVENTS_LOG_COMPACT_EVERY:
+            logger.info(f"Compacting events log after {_events_log_appends} records")
+            save_db(db)
+
+
+def flush_events_log():
+    """Write buffered events-log records to disk in one append."""
+    global _events_log_offset
+    with _db_lock:
+        if not _pending_log_lines:
+            return
+        data = b''.join(_pending_log_lines)
+        written = 0
+        try:
+            with open(_pending_log_path, 'ab', buffering=0) as fh:
+                while written < len(data):
+                    written += fh.write(data[written:])
+                end = fh.tell()
+        except Exception as e:
+            # The events were already acknowledged: keep whatever didn't reach
+            # the disk (the rest of a half-written record included) for the
+            # next flush
+            logger.error(f"Failed to append to events log: {e}")
+            _pending_log_lines[:] = [data[written:]]
+            return
+        _pending_log_lines.clear()
+        # If someone else appended since our last read, leave the offset where
+        # it is so the next load_db() picks their records up (ours are skipped)
+        if end - len(data) == _events_log_offset:
+            _events_log_offset = end
+
+
+def _flush_events_log_if_due():
+    if _pending_log_lines and time.monotonic() - _pending_log_since >= EVENTS_LOG_FLUSH_INTERVAL:
+        flush_events_log()
+
+
+def _log_writer_loop():
+    # Exits once it is no longer the registered writer (the tests swap it out)
+    me = threading.current_thread()
+    while True:
+        time.sleep(EVENTS_LOG_FLUSH_INTERVAL)
+        if _log_writer is not me:
+            return
+        flush_events_log()
+
+
+def _start_log_writer():
+    global _log_writer
+    if _log_writer is None:
+        _log_writer = threading.Thread(target=_log_writer_loop, name='events-log-writer', daemon=True)
+        _log_writer.start()
+
+
+# Write out the last batch on a clean shutdown
+atexit.register(flush_events_log)
+
+
+def _rebuild_indexes(db):
+    """Build the token/id lookup dicts for ``db`` in a single pass."""
+    global _indexed_db, _user_by_token, _user_by_id, _household_by_id, _users_by_household
+    global _household_by_invite, _user_by_email, _users_by_username
+    user_by_token = {}
+    user_by_id = {}
+    users_by_household = {}
+    user_by_email = {}
+    users_by_username = {}
+    for u in db['users']:
+        if u.get('token'):
+            user_by_token.setdefault(u['token'], u)
+        user_by_id.setdefault(u['id'], u)
+        users_by_household.setdefault(u['householdId'], []).append(u)
+        email = (u.get('email') or '').strip().lower()
+        if email:
+            user_by_email.setdefault(email, u)
+        username = (u.get('username') or '').strip().lower()
+        if username:
+            users_by_username.setdefault(username, []).append(u)
+    household_by_id = {}
+    household_by_invite = {}
+    for h in db['households']:
+        household_by_id.setdefault(h['id'], h)
+        for invite in h.get('inviteTokens', []):
+            household_by_invite.setdefault(invite, h)
+    # Swap in complete dicts so concurrent readers never see a partial index
+    _user_by_token, _user_by_id, _household_by_id = user_by_token, user_by_id, household_by_id
+    _users_by_household, _household_by_invite = users_by_household, household_by_invite
+    _user_by_email, _users_by_username = user_by_email, users_by_username
+    _indexed_db = db
+
+
+def _ensure_indexes(db):
+    if db is not _indexed_db:
+        _rebuild_indexes(db)
 
 
 def get_user_by_token(db, token):
     """Return the user dict matching the given token, or None."""
-    for u in db['users']:
-        if u.get('token') == token:
-            return u
-    return None
+    _ensure_indexes(db)
+    return _user_by_token.get(token)
+
+
+def get_user_by_id(db, user_id):
+    """Return the user dict with the given id, or None."""
+    _ensure_indexes(db)
+    return _user_by_id.get(user_id)
+
+
+def get_user_by_email(db, email):
+    """Return the user registered with ``email`` (case-insensitive), or None."""
+    _ensure_indexes(db)
+    return _user_by_email.get(email.strip().lower())
+
+
+def get_users_by_username(db, username):
+    """Return the users whose username matches case-insensitively."""
+    _ensure_indexes(db)
+    return _users_by_username.get(username.strip().lower(), [])
 
 
 def get_household(db, household_id):
-    for h in db['households']:
-        if h['id'] == household_id:
-            return h
-    return None
+    _ensure_indexes(db)
+    return _household_by_id.get(household_id)
+
+
+def get_household_by_invite(db, invite_token):
+    """Return the household that issued ``invite_token``, or None."""
+    _ensure_indexes(db)
+    return _household_by_invite.get(invite_token)
+
+
+def get_household_users(db, household_id):
+    """Return the users of a household, in db order."""
+    _ensure_indexes(db)
+    return _users_by_household.get(household_id, [])
+
+
+def _ensure_event_index(db):
+    global _events_indexed_db, _events_by_household
+    if db is _events_indexed_db:
+        return
+    by_household = {}
+    for e in db['events']:
+        by_household.setdefault(e['householdId'], {})[e['id']] = e
+    _events_by_household = by_household
+    _events_indexed_db = db
+
+
+def get_household_events(db, household_id):
+    """Return a view of the household's events, in db order."""
+    _ensure_event_index(db)
+    return _events_by_household.get(household_id, {}).values()
+
+
+def get_household_event(db, household_id, event_id):
+    _ensure_event_index(db)
+    return _events_by_household.get(household_id, {}).get(event_id)
 
 
-def _start_of_today():
-    """Return a datetime for the start of the current day (local time)."""
-    now = datetime.datetime.now()
-    return datetime.datetime(year=now.year, month=now.month, day=now.day)
+def _add_event_in_memory(db, event):
+    db['events'].append(event)
+    _ensure_event_index(db)
+    _events_by_household.setdefault(event['householdId'], {})[event['id']] = event
+    _household_version[event['householdId']] += 1
+    _scoreboard_event_added(db, event)
+
+
+def _remove_event_in_memory(db, event):
+    db['events'].remove(event)
+    _ensure_event_index(db)
+    _events_by_household.get(event['householdId'], {}).pop(event['id'], None)
+    _household_version[event['householdId']] += 1
+    _scoreboard_event_removed(db, event)
+
+
+def add_event(db, event):
+    """Record a new event in memory and append it to the events log."""
+    _add_event_in_memory(db, event)
+    append_event_record(db, event)
+
+
+def remove_event(db, event):
+    """Remove an event from memory and append a tombstone to the events log."""
+    _remove_event_in_memory(db, event)
+    append_event_record(db, {'_del': event['id'], 'householdId': event['householdId']})
+
+
+def clear_household_events(db, household_id):
+    """Delete every event of a household and save. Returns the number removed."""
+    _ensure_event_index(db)
+    removed = len(_events_by_household.pop(household_id, {}))
+    if removed:
+        db['events'] = [e for e in db['events'] if e['householdId'] != household_id]
+    _household_version[household_id] += 1
+    _scoreboard_invalidate(household_id)
+    save_db(db)
+    return removed
+
+
+# A simple point system for each event type; anything else scores 0
+POINTS_FOR_EVENT = {
+    'feed_morning': 1,
+    'feed_evening': 1,
+    'walk': 1,
+    'walk_morning': 1,
+    'walk_afternoon': 1,
+    'walk_evening': 1,
+    'pee': 2,
+    'poop': 3,
+    'reward': 1,
+    'accident': -2,
+}
 
 
 def compute_points_for_event(event_type):
-    """Define a simple point system for each event type."""
-    return {
-        'feed_morning': 1,
-        'feed_evening': 1,
-        'walk': 1,
-        'pee': 2,
-        'poop': 3,
-        'reward': 1,
-        'accident': -2,
-    }.get(event_type, 0)
+    """Return the points an event type is worth."""
+    return POINTS_FOR_EVENT.get(event_type, 0)
 
 
 def _event_date(ts):
     return datetime.datetime.fromtimestamp(ts).date()
 
 
-def compute_scoreboard(db, household_id):
-    """Compute rich per-user stats and family totals for a household."""
-    today = _start_of_today().date()
-    week_ago = today - datetime.timedelta(days=6)
-
-    # index users in this household
-    users = [u for u in db['users'] if u['householdId'] == household_id]
-    user_index = {u['id']: u for u in users}
-
-    # Prepare accumulators
-    per_user = {
-        u['id']: {
-            'totalPoints': 0,
-            'weeklyPoints': 0,
-            'eventsByDay': {},  # date -> list of events
-            'rawCounts': {},  # event_type -> count
-        }
-        for u in users
-    }
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
 
-    seen_for_points = set()  # (userId, event_type, date)
 
-    for event in db['events']:
-        if event['householdId'] != household_id:
-            continue
+def _day_index(ts, utc_offset):
+    """Local day number (days since 1970-01-01) of a timestamp.
+
+    Plain int arithmetic instead of datetime.fromtimestamp(ts).date(). The
+    offset is sampled once per day, so events from before a DST change may
+    land an hour off around midnight.
+    """
+    return int((ts + utc_offset) // 86400)
+
+
+def _date_to_day_index(date):
+    return date.toordinal() - _EPOCH_ORDINAL
+
+
+# /api/today schedule flags, one bit each. The first five keys are always
+# returned; the per-time-of-day walk keys only when set.
+SCHEDULE_FLAGS = (
+    ('hasMorningFeed', 1),
+    ('hasEveningFeed', 2),
+    ('hasWalk', 4),
+    ('hasPee', 8),
+    ('hasPoop', 16),
+)
+WALK_SCHEDULE_FLAGS = (
+    ('hasWalkMorning', 32),
+    ('hasWalkAfternoon', 64),
+    ('hasWalkEvening', 128),
+)
+EVENT_BITS = {
+    'feed_morning': 1,
+    'feed_evening': 2,
+    'walk_morning': 4 | 32,
+    'walk_afternoon': 4 | 64,
+    'walk_evening': 4 | 128,
+    'pee': 8,
+    'poop': 16,
+}
+
+
+def _schedule_bits(event):
+    """Return the schedule bits an event sets."""
+    bits = EVENT_BITS.get(event.get('type'), 0)
+    if event.get('type') == 'walk':
+        # legacy generic walk: bucket by local hour of the event
+        try:
+            hour = datetime.datetime.fromtimestamp(event.get('timestamp')).hour
+        except Exception:
+            return 4
+        if 4 <= hour < 12:
+            bits = 4 | 32
+        elif 12 <= hour < 18:
+            bits = 4 | 64
+        else:
+            bits = 4 | 128
+    return bits
+
+
+def _schedule_from_mask(mask):
+    schedule = {key: bool(mask & bit) for key, bit in SCHEDULE_FLAGS}
+    for key, bit in WALK_SCHEDULE_FLAGS:
+        if mask & bit:
+            schedule[key] = True
+    return schedule
+
+
+def _scoreboard_apply(state, event, sign, today):
+    """Add (sign=1) or remove (sign=-1) one event from a household's state.
+
+    Points are de-duplicated by (user, event_type, date): only the first
+    occurrence of a given type for that user per day yields points, so a
+    Counter tracks how many scoring events share each key. ``today`` and all dates
+    are local day indexes (see _day_index).
+    """
+    user_id = event.get('userId')
+    day = _day_index(event['timestamp'], _scoreboard_utc_offset)
+    evt_type = event['type']
+
+    # household events bucketed by local day
+    day_events = state['eventsByDay'].setdefault(day, [])
+    if sign > 0:
+        day_events.append(event)
+        if day == today:
+            state['todaySchedule'] |= _schedule_bits(event)
+    else:
+        day_events.remove(event)
+        if day == today:
+            # a flag may still be set by another event, so rebuild from the day
+            mask = 0
+            for e in day_events:
+                mask |= _schedule_bits(e)
+            state['todaySchedule'] = mask
+        if not day_events:
+            del state['eventsByDay'][day]
+
+    info = state['users'].setdefault(user_id, {
+        'totalPoints': 0,
+        'weeklyPoints': 0,
+        'eventsByDay': Counter(),  # day index -> number of events
+    })
+    info['eventsByDay'][day] += sign
+    if info['eventsByDay'][day] <= 0:
+        del info['eventsByDay'][day]
+
+    pts = POINTS_FOR_EVENT.get(evt_type, 0) * sign
+    if pts == 0:
+        return  # non-scoring types never enter the dedup counter
+    key = (user_id, evt_type, day)
+    seen = state['seen']
+    seen[key] += sign
+    if seen[key] <= 0:
+        del seen[key]
+    # Points only change when the first event of a key appears or the last
+    # one disappears
+    if (sign > 0 and seen.get(key) != 1) or (sign < 0 and key in seen):
+        return
+
+    info['totalPoints'] += pts
+    if today - 6 <= day <= today:
+        info['weeklyPoints'] += pts
+
+
+def _scoreboard_build(events, today, utc_offset):
+    """Build a household state from its events in one batch pass.
+
+    Same result as calling _scoreboard_apply(state, event, 1, today) per
+    event, but with the lookups hoisted into locals and no delete branches,
+    since this pass runs over the full history.
+    """
+    seen = Counter()
+    users = {}
+    events_by_day = {}
+    schedule = 0
+    week_ago = today - 6
+    points_for = POINTS_FOR_EVENT.get
+    for event in events:
         user_id = event.get('userId')
-        if user_id not in per_user:
-            continue
-        date = _event_date(event['timestamp'])
+        day = int((event['timestamp'] + utc_offset) // 86400)
         evt_type = event['type']
 
-        # accumulate raw counts and history
-        info = per_user[user_id]
-        info['rawCounts'][evt_type] = info['rawCounts'].get(evt_type, 0) + 1
-        info['eventsByDay'].setdefault(date, []).append(event)
+        day_events = events_by_day.get(day)
+        if day_events is None:
+            day_events = events_by_day[day] = []
+        day_events.append(event)
+        if day == today:
+            schedule |= _schedule_bits(event)
 
-        # de-duplicate for scoring
-        key = (user_id, evt_type, date)
-        if key in seen_for_points:
-            continue
-        seen_for_points.add(key)
+        info = users.get(user_id)
+        if info is None:
+            info = users[user_id] = {'totalPoints': 0, 'weeklyPoints': 0, 'eventsByDay': Counter()}
+        info['eventsByDay'][day] += 1
 
-        pts = compute_points_for_event(evt_type)
-        if pts == 0:
+        pts = points_for(evt_type, 0)
+        if not pts:
+            continue
+        key = (user_id, evt_type, day)
+        seen[key] += 1
+        if seen[key] != 1:
             continue
         info['totalPoints'] += pts
-        if week_ago <= date <= today:
+        if week_ago <= day <= today:
             info['weeklyPoints'] += pts
+    return {'seen': seen, 'users': users, 'eventsByDay': events_by_day, 'todaySchedule': schedule}
+
+
+def _scoreboard_state(db, household_id):
+    """Return the cached scoreboard state for a household, building it if needed."""
+    global _scoreboard_db, _scoreboard_day, _scoreboard_utc_offset
+    utc_offset = time.localtime().tm_gmtoff
+    today = _day_index(time.time(), utc_offset)
+    if db is not _scoreboard_db or today != _scoreboard_day:
+        _scoreboard_cache.clear()
+        _scoreboard_db = db
+        _scoreboard_day = today
+        _scoreboard_utc_offset = utc_offset
+
+    state = _scoreboard_cache.get(household_id)
+    if state is None:
+        state = _scoreboard_build(get_household_events(db, household_id), today, utc_offset)
+        _scoreboard_cache[household_id] = state
+    return state
+
+
+def get_household_events_on(db, household_id, date):
+    """Return the household's events whose local date is ``date``, in db order."""
+    state = _scoreboard_state(db, household_id)
+    return state['eventsByDay'].get(_date_to_day_index(date), [])
+
+
+def get_today_schedule(db, household_id):
+    """Return the /api/today schedule flags for a household."""
+    return _schedule_from_mask(_scoreboard_state(db, household_id)['todaySchedule'])
+
 
-    # compute streaks
-    for user_id, info in per_user.items():
+def _scoreboard_event_added(db, event):
+    """Write-through update of the cached scoreboard for a new event."""
+    if db is _scoreboard_db:
+        state = _scoreboard_cache.get(event['householdId'])
+        if state is not None:
+            _scoreboard_apply(state, event, 1, _scoreboard_day)
+
+
+def _scoreboard_event_removed(db, event):
+    """Write-through update of the cached scoreboard for a deleted event."""
+    if db is _scoreboard_db:
+        state = _scoreboard_cache.get(event['householdId'])
+        if state is not None:
+            _scoreboard_apply(state, event, -1, _scoreboard_day)
+
+
+def _scoreboard_invalidate(household_id):
+    _scoreboard_cache.pop(household_id, None)
+
+
+def compute_scoreboard(db, household_id):
+    """Compute rich per-user stats and family totals for a household."""
+    state = _scoreboard_state(db, household_id)
+    today = _scoreboard_day
+
+    scoreboard = []
+    family_total = family_weekly = 0
+    for u in get_household_users(db, household_id):
+        info = state['users'].get(u['id'])
+        if info is None:
+            scoreboard.append({
+                'userId': u['id'],
+                'username': u['username'],
+                'totalPoints': 0,
+                'weeklyPoints': 0,
+                'streak': 0,
+            })
+            continue
+        family_total += info['totalPoints']
+        family_weekly += info['weeklyPoints']
+        # streak: consecutive days with events, counting back from today
         streak = 0
         day = today
-        while True:
-            if day in info['eventsByDay']:
-                streak += 1
-                day = day - datetime.timedelta(days=1)
-            else:
-                break
-        info['streak'] = streak
-
-    # assemble result
-    scoreboard = []
-    for user_id, info in per_user.items():
-        u = user_index[user_id]
+        while day in info['eventsByDay']:
+            streak += 1
+            day -= 1
         scoreboard.append({
-            'userId': user_id,
+            'userId': u['id'],
             'username': u['username'],
             'totalPoints': info['totalPoints'],
             'weeklyPoints': info['weeklyPoints'],
-            'streak': info['streak'],
+            'streak': streak,
         })
     scoreboard.sort(key=lambda x: x['totalPoints'], reverse=True)
 
-    family_total = sum(row['totalPoints'] for row in scoreboard)
-    family_weekly = sum(row['weeklyPoints'] for row in scoreboard)
-
     return {
         'scoreboard': scoreboard,
         'familyTotal': family_total,
@@ -220,6 +772,51 @@ def compute_scoreboard(db, household_id):
     }
 
 
+def api_locked(view):
+    """Run an API view under _db_lock, like server.py's _handle_api.
+
+    The handlers mutate and iterate the shared in-memory db, indexes and
+    scoreboard state, so load -> change -> compute must not interleave with
+    another request. The body is read before taking the lock (get_json
+    reuses it) so a slow upload doesn't hold up other requests.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        request.get_data(cache=True)
+        with _db_lock:
+            return view(*args, **kwargs)
+    return wrapper
+
+
+def json_response(data, status=200):
+    """Like jsonify, but orjson's bytes go straight into the response without
+    the str round-trip (used on the hot endpoints)."""
+    return make_response(orjson.dumps(data), status, {'Content-Type': 'application/json'})
+
+
+def household_etag(household_id):
+    """Weak ETag for household data that changes with events, db saves and the day."""
+    today = _day_index(time.time(), time.localtime().tm_gmtoff)
+    version = _household_version[household_id]
+    return f'W/"{_EVENT_ID_PREFIX}-{_db_generation}-{household_id}-{version}-{today}"'
+
+
+def etag_matches(etag):
+    return request.headers.get('If-None-Match') == etag
+
+
+def with_etag(resp, etag):
+    """Attach ``etag`` to a response; clients must revalidate before reuse."""
+    resp.headers['ETag'] = etag
+    resp.headers['Cache-Control'] = 'no-cache'
+    return resp
+
+
+def include_requested(name):
+    """True if ``name`` is listed in the comma-separated ``?include=`` parameter."""
+    return name in request.args.get('include', '').split(',')
+
+
 def get_auth_token():
     """Extract Bearer token from Authorization header."""
     auth_header = request.headers.get('Authorization', '')
@@ -234,6 +831,7 @@ def get_auth_token():
 # ============================================================================
 
 @app.route('/api/register', methods=['POST'])
+@api_locked
 def api_register():
     """Register a new user."""
     data = request.get_json()
@@ -252,18 +850,16 @@ def api_register():
     logger.info(f"Registering user: {email}, invite: {bool(invite_token)}")
     
     # Check if email already exists
-    if any(u.get('email', '').lower() == email for u in db['users']):
+    if get_user_by_email(db, email) is not None:
         return jsonify({'error': 'email already exists'}), 400
     
     # Determine household
     household_id = None
     if invite_token:
-        for h in db['households']:
-            if invite_token in h.get('inviteTokens', []):
-                household_id = h['id']
-                break
-        if household_id is None:
+        invited_to = get_household_by_invite(db, invite_token)
+        if invited_to is None:
             return jsonify({'error': 'invalid invite token'}), 400
+        household_id = invited_to['id']
     
     # Create household if not provided
     if not household_id:
@@ -283,7 +879,7 @@ def api_register():
     token = uuid.uuid4().hex
     
     # Check if this is the first user in the household (becomes admin)
-    is_admin = not any(u['householdId'] == household_id for u in db['users'])
+    is_admin = not get_household_users(db, household_id)
     
     db['users'].append({
         'id': user_id,
@@ -321,6 +917,7 @@ def api_register():
 
 
 @app.route('/api/login', methods=['POST'])
+@api_locked
 def api_login():
     """Login existing user."""
     data = request.get_json()
@@ -331,18 +928,15 @@ def api_login():
 
     db = load_db()
     identifier = data['email'].strip()
-    identifier_l = identifier.lower()
     password = data['password']
 
     # Allow login by email OR username (fallback). Compare case-insensitively.
     user = None
-    for u in db['users']:
-        user_email = (u.get('email') or '').strip().lower()
-        username = (u.get('username') or '').strip().lower()
-        if (user_email and user_email == identifier_l) or (username and username == identifier_l):
-            if u.get('password') == password:
-                user = u
-                break
+    by_email = get_user_by_email(db, identifier)
+    for u in ([by_email] if by_email else []) + get_users_by_username(db, identifier):
+        if u.get('password') == password:
+            user = u
+            break
     
     if not user:
         logger.warning(f"Login failed for: {identifier}")
@@ -365,6 +959,7 @@ def api_login():
 
 
 @app.route('/api/user', methods=['GET'])
+@api_locked
 def api_user():
     """Get current user info."""
     token = get_auth_token()
@@ -377,7 +972,8 @@ def api_user():
         return jsonify({'error': 'invalid token'}), 401
     
     household = get_household(db, user['householdId'])
-    scores = compute_scoreboard(db, user['householdId'])
+    # The scoreboard is opt-in (?include=scores); /api/scores serves it on its own
+    scores = compute_scoreboard(db, user['householdId']) if include_requested('scores') else {}
     
     # Build invite tokens with optional linked username
     invite_tokens = []
@@ -386,10 +982,8 @@ def api_user():
         links = household.get('inviteLinks', {})
         linked_id = links.get(t)
         if linked_id:
-            for u in db['users']:
-                if u['id'] == linked_id:
-                    linked_user = u.get('username')
-                    break
+            linked = get_user_by_id(db, linked_id)
+            linked_user = linked.get('username') if linked else None
         invite_tokens.append({'token': t, 'linkedUsername': linked_user})
 
     return jsonify({
@@ -407,6 +1001,7 @@ def api_user():
 
 
 @app.route('/api/dog', methods=['POST'])
+@api_locked
 def api_dog():
     """Update dog profile."""
     token = get_auth_token()
@@ -452,7 +1047,7 @@ def api_dog():
         household['dogPhotoUrl'] = data['dogPhotoUrl']
 
     save_db(db)
-    scores = compute_scoreboard(db, user['householdId'])
+    scores = compute_scoreboard(db, user['householdId']) if include_requested('scores') else {}
 
     return jsonify({
         'dogName': household.get('dogName', ''),
@@ -463,6 +1058,7 @@ def api_dog():
 
 
 @app.route('/api/events', methods=['POST'])
+@api_locked
 def api_events_post():
     """Record a new event."""
     token = get_auth_token()
@@ -494,24 +1090,23 @@ def api_events_post():
 
     logger.info(f"POST /api/events - User {user['username']} added event: {event_type}")
     
-    event_id = uuid.uuid4().hex
+    event_id = f"{_EVENT_ID_PREFIX}{next(_event_id_counter):x}"
     # Use timezone-aware UTC timestamp
     timestamp = datetime.datetime.now(datetime.timezone.utc).timestamp()
     
-    db['events'].append({
+    event = {
         'id': event_id,
         'householdId': user['householdId'],
         'userId': user['id'],
         'type': event_type,
         'timestamp': timestamp
-    })
-    
-    save_db(db)
+    }
+    add_event(db, event)
     scores = compute_scoreboard(db, user['householdId'])
     
     logger.info(f"Event recorded: {event_type}, new family total: {scores['familyTotal']}")
     
-    return jsonify({
+    return json_response({
         'success': True,
         'eventId': event_id,
         **scores
@@ -519,6 +1114,7 @@ def api_events_post():
 
 
 @app.route('/api/events/<event_id>', methods=['DELETE'])
+@api_locked
 def api_events_delete(event_id):
     """Delete a single event."""
     token = get_auth_token()
@@ -531,21 +1127,16 @@ def api_events_delete(event_id):
         return jsonify({'error': 'invalid token'}), 401
     
     # Find and remove the event
-    event = None
-    for i, e in enumerate(db['events']):
-        if e['id'] == event_id and e['householdId'] == user['householdId']:
-            event = db['events'].pop(i)
-            break
-    
+    event = get_household_event(db, user['householdId'], event_id)
     if not event:
         return jsonify({'error': 'event not found'}), 404
     
-    save_db(db)
+    remove_event(db, event)
     scores = compute_scoreboard(db, user['householdId'])
     
     logger.info(f"Event deleted: {event_id} by {user['username']}")
     
-    return jsonify({
+    return json_response({
         'success': True,
         'message': 'Event deleted',
         **scores
@@ -553,6 +1144,7 @@ def api_events_delete(event_id):
 
 
 @app.route('/api/scores', methods=['GET'])
+@api_locked
 def api_scores():
     """Get scoreboard."""
     token = get_auth_token()
@@ -564,11 +1156,16 @@ def api_scores():
     if not user:
         return jsonify({'error': 'invalid token'}), 401
     
+    etag = household_etag(user['householdId'])
+    if etag_matches(etag):
+        return with_etag(make_response('', 304), etag)
+
     scores = compute_scoreboard(db, user['householdId'])
-    return jsonify(scores)
+    return with_etag(json_response(scores), etag)
 
 
 @app.route('/api/today', methods=['GET'])
+@api_locked
 def api_today():
     """Get today's events and schedule status."""
     token = get_auth_token()
@@ -581,95 +1178,52 @@ def api_today():
         return jsonify({'error': 'invalid token'}), 401
     
     logger.info(f"GET /api/today - User: {user['username']}")
+
+    etag = household_etag(user['householdId'])
+    if etag_matches(etag):
+        return with_etag(make_response('', 304), etag)
     
-    today_start = _start_of_today()
-    today_ts = today_start.timestamp()
+    today = datetime.date.today()
     
     # Get today's events
     events = []
-    schedule = {
-        'hasMorningFeed': False,
-        'hasEveningFeed': False,
-        'hasWalk': False,
-        'hasPee': False,
-        'hasPoop': False
-    }
+    schedule = get_today_schedule(db, user['householdId'])
     
     # Debug: counts for events inspected
+    household_events = get_household_events(db, user['householdId'])
+    today_events = get_household_events_on(db, user['householdId'], today)
     total_events = len(db.get('events', []))
-    matched_household = 0
-    matched_today = 0
-    sample_timestamps = []
-    for event in db.get('events', []):
-        if event.get('householdId') == user['householdId']:
-            matched_household += 1
-            sample_timestamps.append(event.get('timestamp'))
-        if event.get('householdId') != user['householdId']:
-            continue
-        if event.get('timestamp', 0) >= today_ts:
-            matched_today += 1
-            # Get username
-            event_user = None
-            for u in db.get('users', []):
-                if u.get('id') == event.get('userId'):
-                    event_user = u
-                    break
-
-            events.append({
-                'id': event.get('id'),
-                'type': event.get('type'),
-                'timestamp': event.get('timestamp'),
-                'userId': event.get('userId'),
-                'username': event_user['username'] if event_user else 'Unknown'
-            })
+    matched_household = len(household_events)
+    matched_today = len(today_events)
+    for event in today_events:
+        # Get username
+        event_user = get_user_by_id(db, event.get('userId'))
+
+        events.append({
+            'id': event.get('id'),
+            'type': event.get('type'),
+            'timestamp': event.get('timestamp'),
+            'userId': event.get('userId'),
+            'username': event_user['username'] if event_user else 'Unknown'
+        })
 
-            # Update schedule
-            if event.get('type') == 'feed_morning':
-                schedule['hasMorningFeed'] = True
-            elif event.get('type') == 'feed_evening':
-                schedule['hasEveningFeed'] = True
-            elif event.get('type') in ('walk_morning', 'walk_afternoon', 'walk_evening'):
-                schedule['hasWalk'] = True
-                if event.get('type') == 'walk_morning':
-                    schedule['hasWalkMorning'] = True
-                elif event.get('type') == 'walk_afternoon':
-                    schedule['hasWalkAfternoon'] = True
-                else:
-                    schedule['hasWalkEvening'] = True
-            elif event.get('type') == 'walk':
-                try:
-                    ev_dt = datetime.datetime.fromtimestamp(event.get('timestamp'))
-                    hour = ev_dt.hour
-                    schedule['hasWalk'] = True
-                    if 4 <= hour < 12:
-                        schedule['hasWalkMorning'] = True
-                    elif 12 <= hour < 18:
-                        schedule['hasWalkAfternoon'] = True
-                    else:
-                        schedule['hasWalkEvening'] = True
-                except Exception:
-                    schedule['hasWalk'] = True
-            elif event.get('type') == 'pee':
-                schedule['hasPee'] = True
-            elif event.get('type') == 'poop':
-                schedule['hasPoop'] = True
-
-    logger.info(f"/api/today debug: total_events={total_events}, matched_household={matched_household}, matched_today={matched_today}, sample_ts_count={len(sample_timestamps)}")
-    if sample_timestamps:
+    logger.info(f"/api/today debug: total_events={total_events}, matched_household={matched_household}, matched_today={matched_today}, sample_ts_count={matched_household}")
+    if household_events:
         # show a sample of timestamps (up to 5) and their converted dates
-        sample = sample_timestamps[:5]
+        sample = [e.get('timestamp') for e in islice(household_events, 5)]
         sample_dates = [str(datetime.datetime.fromtimestamp(t)) for t in sample]
         logger.info(f"/api/today sample timestamps: {sample} -> {sample_dates}")
     
     logger.info(f"Returning {len(events)} events for today")
     
-    return jsonify({
+    return with_etag(json_response({
         'events': events,
         'schedule': schedule
-    })
+    }), etag)
 
 
 @app.route('/api/history', methods=['GET'])
+@api_locked
 def api_history():
     """Get events for a specific date."""
     token = get_auth_token()
@@ -692,29 +1246,21 @@ def api_history():
     
     # Get events for the date
     events = []
-    for event in db['events']:
-        if event['householdId'] != user['householdId']:
-            continue
-        event_date = _event_date(event['timestamp'])
-        if event_date == target_date:
-            event_user = None
-            for u in db['users']:
-                if u['id'] == event['userId']:
-                    event_user = u
-                    break
-            
-            events.append({
-                'id': event['id'],
-                'type': event['type'],
-                'timestamp': event['timestamp'],
-                'userId': event['userId'],
-                'username': event_user['username'] if event_user else 'Unknown'
-            })
+    for event in get_household_events_on(db, user['householdId'], target_date):
+        event_user = get_user_by_id(db, event['userId'])
+        events.append({
+            'id': event['id'],
+            'type': event['type'],
+            'timestamp': event['timestamp'],
+            'userId': event['userId'],
+            'username': event_user['username'] if event_user else 'Unknown'
+        })
     
     return jsonify({'events': events})
 
 
 @app.route('/api/invite', methods=['POST'])
+@api_locked
 def api_invite():
     """Generate a new invite token."""
     token = get_auth_token()
@@ -743,10 +1289,8 @@ def api_invite():
         linked = None
         linked_id = household.get('inviteLinks', {}).get(t)
         if linked_id:
-            for u in db['users']:
-                if u['id'] == linked_id:
-                    linked = u.get('username')
-                    break
+            linked_user = get_user_by_id(db, linked_id)
+            linked = linked_user.get('username') if linked_user else None
         invite_tokens.append({'token': t, 'linkedUsername': linked})
 
     return jsonify({
@@ -756,6 +1300,7 @@ def api_invite():
 
 
 @app.route('/api/invite/reset', methods=['POST'])
+@api_locked
 def api_invite_reset():
     """Reset all invite tokens."""
     token = get_auth_token()
@@ -785,6 +1330,7 @@ def api_invite_reset():
 
 
 @app.route('/api/household/members', methods=['GET'])
+@api_locked
 def api_household_members():
     """List members in the caller's household with their manager status."""
     token = get_auth_token()
@@ -803,13 +1349,14 @@ def api_household_members():
             'email': u.get('email', ''),
             'isAdmin': u.get('isAdmin', False)
         }
-        for u in db['users'] if u['householdId'] == user['householdId']
+        for u in get_household_users(db, user['householdId'])
     ]
 
     return jsonify({'members': members})
 
 
 @app.route('/api/household/members/<member_id>/manager', methods=['POST'])
+@api_locked
 def api_set_manager(member_id):
     """Set or unset manager status for a household member. Caller must be a manager."""
     token = get_auth_token()
@@ -828,11 +1375,9 @@ def api_set_manager(member_id):
     make_manager = bool(data.get('isAdmin'))
 
     # Find the member in same household
-    member = None
-    for u in db['users']:
-        if u['id'] == member_id and u['householdId'] == caller['householdId']:
-            member = u
-            break
+    member = get_user_by_id(db, member_id)
+    if member and member['householdId'] != caller['householdId']:
+        member = None
 
     if not member:
         return jsonify({'error': 'member not found'}), 404
@@ -846,6 +1391,7 @@ def api_set_manager(member_id):
 
 
 @app.route('/api/admin/reset-scores', methods=['POST'])
+@api_locked
 def api_admin_reset_scores():
     """Admin: Reset all scores (delete all events)."""
     token = get_auth_token()
@@ -863,8 +1409,7 @@ def api_admin_reset_scores():
     logger.info(f"All scores reset by admin {user['username']} for household {user['householdId']}")
     
     # Remove all events for this household
-    db['events'] = [e for e in db['events'] if e['householdId'] != user['householdId']]
-    save_db(db)
+    clear_household_events(db, user['householdId'])
     
     scores = compute_scoreboard(db, user['householdId'])
     
@@ -876,6 +1421,7 @@ def api_admin_reset_scores():
 
 
 @app.route('/api/admin/clear-events', methods=['POST'])
+@api_locked
 def api_admin_clear_events():
     """Admin: Clear all events."""
     token = get_auth_token()
@@ -890,15 +1436,11 @@ def api_admin_clear_events():
     if not user.get('isAdmin'):
         return jsonify({'error': 'admin only'}), 403
     
-    # Count events before clearing
-    event_count = len([e for e in db['events'] if e['householdId'] == user['householdId']])
+    # Remove all events for this household
+    event_count = clear_household_events(db, user['householdId'])
     
     logger.info(f"All {event_count} events cleared by admin {user['username']} for household {user['householdId']}")
     
-    # Remove all events for this household
-    db['events'] = [e for e in db['events'] if e['householdId'] != user['householdId']]
-    save_db(db)
-    
     scores = compute_scoreboard(db, user['householdId'])
     
     return jsonify({
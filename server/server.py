@@ -7,7 +7,9 @@ persistent storage. It also serves the static files for the client app
 located in the sibling ``client`` directory. There is no external
 dependency: everything is handled via Python's built-in HTTP
 infrastructure. This means the app can run in a constrained environment
-without access to external package repositories.
+without access to external package repositories. If ``orjson`` happens to
+be installed it is used for JSON encoding/decoding, which is several times
+faster than the stdlib ``json`` module.
 
 All data is stored in a single JSON file (db.json) with the following
 structure::
@@ -18,6 +20,10 @@ structure::
         "events": [ ... ]
     }
 
+New and deleted events are first appended to ``db.events.ndjson`` next to
+db.json (one JSON record per line) and folded back into db.json
+periodically, so recording an event does not rewrite the whole file.
+
 The server exposes a small REST-like API (see code for details).
 
 Endpoints:
@@ -46,8 +52,9 @@ POST /api/dog
 POST /api/events
     Body: {"type": str}
     Header: Authorization: Bearer <token>
-    Records a new event (feed/walk/pee/poop/reward) and updates points
-    accordingly.
+    Records a new event (feed/walk/pee/poop/reward) and returns its id.
+    The updated scoreboard is computed in the background; fetch it from
+    /api/scores.
 
 POST /api/invite
     Header: Authorization: Bearer <token>
@@ -73,13 +80,30 @@ PORT environment variable.
 
 import json
 import os
-import uuid
+import secrets
 import datetime
+import time
 import logging
 import sys
-from http.server import SimpleHTTPRequestHandler, HTTPServer
+import shutil
+import signal
+import atexit
+import gzip
+import hashlib
+import mmap
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate, parsedate_to_datetime
+from functools import lru_cache, wraps
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import urlparse, parse_qs
 
+try:
+    import orjson
+except ImportError:  # optional speed-up, the stdlib json module works too
+    orjson = None
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -92,57 +116,324 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+# Where db.json lives unless DB_FILE names the file itself
+APP_HOME = os.environ.get('DOG_APP_HOME') or SCRIPT_DIR
 # Allow overriding the data file via DB_FILE env var (useful on PythonAnywhere)
-DATA_FILE = os.environ.get('DB_FILE') or os.path.join(SCRIPT_DIR, 'db.json')
+DATA_FILE = os.environ.get('DB_FILE') or os.path.join(APP_HOME, 'db.json')
 # Absolute client dir path
 CLIENT_DIR = os.path.abspath(os.path.join(SCRIPT_DIR, '..', 'client'))
+# Every served file path must start with this (the separator keeps a
+# sibling such as ../client-old from matching)
+_CLIENT_ABS = os.path.join(CLIENT_DIR, '')
+
+# New events are appended to a sidecar log (one JSON record per line) instead
+# of rewriting db.json on every request; the log is folded back into db.json
+# on every save_db and after this many appends. flask_server.py reads and
+# writes the same file in the same format.
+EVENTS_LOG_COMPACT_EVERY = 500
 
 # Database cache to avoid reading from disk on every request
 _db_cache = None
 _db_cache_mtime = None
+_events_log_offset = 0  # bytes of the events log already applied to the cache
+_events_log_appends = 0  # records in the events log since the last compaction
+_events_log_fd = None  # O_APPEND descriptor kept open between appends
+_events_log_fd_path = None
+# The server handles each connection on its own thread; API requests hold
+# this lock while they touch the db and the caches below, and the storage
+# functions take it too (see _locked) for callers outside a request.
+_db_lock = threading.RLock()
+# Runs work that can happen after the response has been sent
+_background = ThreadPoolExecutor(max_workers=1)
+
+# Changes that do not need to be on disk before the response (dog profile,
+# invites) are saved after SAVE_DELAY seconds, or once SAVE_MAX_PENDING of
+# them have piled up, so a burst of them costs one db.json write.
+SAVE_DELAY = 0.05
+SAVE_MAX_PENDING = 32
+_dirty_db = None
+_dirty_count = 0
+_save_timer = None
+
+# Local day the day-keyed caches below were built for, and the UTC offset
+# (seconds) sampled for it; see _current_day.
+_today_index = None
+_utc_offset = 0
+
+# Per-household scoreboard state, kept up to date as events are added and
+# removed instead of rescanning every event on each request.
+_scoreboard_db = None
+_scoreboard_cache = {}
+
+# Lookup indexes over the cached db, rebuilt whenever a different db object
+# is seen or the db is saved (every user/household change goes through
+# save_db).
+_indexed_db = None
+_user_by_token = {}
+_user_by_id = {}
+_user_by_email = {}  # lowercased email -> user
+_users_by_username = {}  # username -> [users]
+_users_by_household = {}
+_household_by_id = {}
+_household_by_invite = {}  # invite token -> household
+
+# Events bucketed per household ({householdId: {eventId: event}}, in
+# insertion order). Kept in sync incrementally by add_event/remove_event.
+_events_indexed_db = None
+_events_by_household = {}
+# Per-household events grouped by local day index ({householdId: {day:
+# [events]}}, each list in timestamp order), built lazily the first time a
+# household's day is asked for.
+_events_by_day = {}
+
+# Encoded JSON bodies of the polled GET endpoints, per household
+# ({householdId: {key: bytes}}). A household's entries are dropped when its
+# events change; save_db and midnight drop them all.
+_body_cache_db = None
+_body_cache = {}
+
+# JSON responses larger than this are gzipped for clients that accept it
+JSON_GZIP_MIN_SIZE = 1024
+
+_STATIC_CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.js': 'application/javascript; charset=utf-8',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.svg': 'image/svg+xml',
+    '.ico': 'image/x-icon'
+}
+# Text assets worth serving gzipped
+_STATIC_GZIP_EXTS = frozenset({'.html', '.css', '.js', '.svg', '.json', '.webmanifest'})
+# App code and markup are revalidated on every load; other assets are cached
+_STATIC_REVALIDATE_EXTS = frozenset({'.html', '.css', '.js'})
+# Client files kept in memory
+# ({abs_path: (mtime_ns, body, gzip_body, etag, last_modified, size)}).
+# Filled at startup and refreshed when a file's mtime changes.
+_static_cache = OrderedDict()  # least recently served first
+_static_lock = threading.Lock()
+STATIC_CACHE_MAX_ENTRIES = 256
+# Larger files (e.g. uploaded dog photos) are not kept in memory; their entry
+# has body None and they are sent from disk with os.sendfile
+STATIC_CACHE_MAX_SIZE = 256 * 1024
+
+
+def _json_dumps(obj, pretty=False):
+    """Serialize ``obj`` to UTF-8 JSON bytes (non-ASCII kept as-is)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data):
+    """Parse JSON from bytes or str. Raises json.JSONDecodeError on bad input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_json_file(path):
+    """Parse a JSON file; with orjson, straight from a read-only mmap so the
+    file is never copied into a bytes object first."""
+    with open(path, 'rb') as fh:
+        if orjson is None or os.fstat(fh.fileno()).st_size == 0:
+            # the stdlib parser needs bytes, and mmap can't map empty files
+            return _json_loads(fh.read())
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _events_log_path(data_file=None):
+    """Path of the append-only events log that sits next to DATA_FILE."""
+    return os.path.splitext(data_file or DATA_FILE)[0] + '.events.ndjson'
+
+
+def _events_log_size():
+    try:
+        return os.path.getsize(_events_log_path())
+    except OSError:
+        return 0
 
-def load_db():
-    """Load the database from disk with caching. Creates an empty db if necessary."""
-    global _db_cache, _db_cache_mtime
-    
-    # Check if file exists
-    if not os.path.exists(DATA_FILE):
+
+def _replay_events_log(db, log_path=None):
+    """Apply the events log to ``db``. Returns (bytes applied, records applied).
+
+    Each line is either an event dict or a ``{"_del": id}`` tombstone. Events
+    whose id is already present are skipped, so replaying a log that was
+    already folded into db.json (e.g. after a crash mid-compaction) is harmless.
+    """
+    try:
+        fh = open(log_path or _events_log_path(), 'rb')
+    except FileNotFoundError:
+        return 0, 0
+    offset = 0
+    count = 0
+    known_ids = {e['id'] for e in db['events']}
+    deleted = set()
+    with fh:
+        for line in fh:
+            if not line.endswith(b'\n'):
+                break  # partially written record, pick it up on the next load
+            offset += len(line)
+            count += 1
+            try:
+                record = _json_loads(line)
+            except json.JSONDecodeError as e:
+                logger.error(f"Skipping corrupt events log record: {e}")
+                continue
+            if '_del' in record:
+                deleted.add(record['_del'])
+            elif record.get('id') not in known_ids:
+                known_ids.add(record.get('id'))
+                db['events'].append(record)
+    if deleted:
+        db['events'] = [e for e in db['events'] if e['id'] not in deleted]
+    return offset, count
+
+
+def _replay_events_log_tail(db):
+    """Apply the events log records written by another process since the
+    last read, keeping the in-memory indexes current instead of reloading
+    db.json. Returns (bytes applied, records applied)."""
+    try:
+        fh = open(_events_log_path(), 'rb')
+    except FileNotFoundError:
+        return 0, 0
+    offset = 0
+    count = 0
+    _ensure_event_index(db)
+    with fh:
+        fh.seek(_events_log_offset)
+        for line in fh:
+            if not line.endswith(b'\n'):
+                break  # partially written record, pick it up on the next load
+            offset += len(line)
+            count += 1
+            try:
+                record = _json_loads(line)
+            except json.JSONDecodeError as e:
+                logger.error(f"Skipping corrupt events log record: {e}")
+                continue
+            if '_del' in record:
+                event = _find_event(db, record.get('householdId'), record['_del'])
+                if event is not None:
+                    _remove_event_in_memory(db, event)
+            elif _find_event(db, record.get('householdId'), record.get('id')) is None:
+                _add_event_in_memory(db, record)
+    return offset, count
+
+
+def _locked(func):
+    """Run ``func`` holding _db_lock."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with _db_lock:
+            return func(*args, **kwargs)
+    return wrapper
+
+
+@_locked
+def load_db(path=None):
+    """Load the database from disk with caching. Creates an empty db if necessary.
+
+    A ``path`` other than DATA_FILE is read directly (with its events log),
+    bypassing the cache.
+    """
+    global _db_cache, _db_cache_mtime, _events_log_offset, _events_log_appends
+    if path is not None and path != DATA_FILE:
+        if not os.path.exists(path):
+            db = {'households': [], 'users': [], 'events': []}
+        else:
+            db = _read_json_file(path)
+        _replay_events_log(db, _events_log_path(path))
+        return db
+
+    # One stat answers both "does it exist" and "has it changed"
+    try:
+        current_mtime = os.stat(DATA_FILE).st_mtime_ns
+    except FileNotFoundError:
+        if _dirty_db is not None:
+            flush_db()
+            return _db_cache
         logger.warning(f"Database file not found at {DATA_FILE}, creating new")
         _db_cache = {'households': [], 'users': [], 'events': []}
         _db_cache_mtime = None
+        _events_log_offset, _events_log_appends = _replay_events_log(_db_cache)
         return _db_cache
     
     # Check if cache is still valid
-    current_mtime = os.path.getmtime(DATA_FILE)
     if _db_cache is not None and _db_cache_mtime == current_mtime:
-        # Cache hit - return cached version
-        return _db_cache
-    
-    # Cache miss - load from disk
-    with open(DATA_FILE, 'r', encoding='utf-8') as fh:
-        try:
-            _db_cache = json.load(fh)
-            _db_cache_mtime = current_mtime
-            logger.debug(f"Database loaded from disk: {len(_db_cache.get('households', []))} households, {len(_db_cache.get('users', []))} users, {len(_db_cache.get('events', []))} events")
+        log_size = _events_log_size()
+        if _events_log_offset == log_size:
+            # Cache hit - return cached version
             return _db_cache
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse database JSON: {e}")
-            _db_cache = {'households': [], 'users': [], 'events': []}
-            _db_cache_mtime = None
+        if _events_log_offset < log_size:
+            # Only the events log grew: apply the new records
+            applied, count = _replay_events_log_tail(_db_cache)
+            _events_log_offset += applied
+            _events_log_appends += count
             return _db_cache
+    
+    if _dirty_db is not None:
+        # Write pending changes before reading anything back from disk
+        flush_db()
+        return _db_cache
+
+    # Cache miss - load from disk
+    try:
+        _db_cache = _read_json_file(DATA_FILE)
+        _db_cache_mtime = current_mtime
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse database JSON: {e}")
+        _db_cache = {'households': [], 'users': [], 'events': []}
+        _db_cache_mtime = None
+    _events_log_offset, _events_log_appends = _replay_events_log(_db_cache)
+    logger.debug(f"Database loaded from disk: {len(_db_cache.get('households', []))} households, {len(_db_cache.get('users', []))} users, {len(_db_cache.get('events', []))} events")
+    return _db_cache
+
 
+def _write_db_file(path, db):
+    """Atomically replace ``path`` with ``db`` and drop its events log."""
+    tmp_file = path + '.tmp'
+    with open(tmp_file, 'wb') as fh:
+        # compact: nothing edits db.json by hand, and it is half the size
+        fh.write(_json_dumps(db))
+    os.replace(tmp_file, path)
+    # the file now holds every event, so the log can go
+    log_path = _events_log_path(path)
+    if os.path.exists(log_path):
+        os.remove(log_path)
 
-def save_db(db):
-    """Persist the database to disk and update cache."""
-    global _db_cache, _db_cache_mtime
+
+@_locked
+def save_db(db, path=None):
+    """Persist the full database to disk, fold in the events log and update cache.
+
+    A ``path`` other than DATA_FILE is written directly; the cache is left alone.
+    """
+    global _db_cache, _db_cache_mtime, _events_log_offset, _events_log_appends
+    global _dirty_db, _dirty_count
+    if path is not None and path != DATA_FILE:
+        _write_db_file(path, db)
+        return
+    # This write covers any pending mark_dirty changes too
+    _dirty_db = None
+    _dirty_count = 0
     try:
-        tmp_file = DATA_FILE + '.tmp'
-        with open(tmp_file, 'w', encoding='utf-8') as fh:
-            json.dump(db, fh, indent=2, ensure_ascii=False)
-        os.replace(tmp_file, DATA_FILE)
+        _close_events_log()
+        _write_db_file(DATA_FILE, db)
+        _events_log_offset = 0
+        _events_log_appends = 0
         # Update cache
         _db_cache = db
-        _db_cache_mtime = os.path.getmtime(DATA_FILE)
+        _db_cache_mtime = os.stat(DATA_FILE).st_mtime_ns
+        _rebuild_indexes(db)
+        _body_cache.clear()
         logger.debug("Database saved successfully")
     except Exception as e:
         logger.error(f"Failed to save database: {e}")
@@ -151,19 +442,227 @@ def save_db(db):
         _db_cache_mtime = None
 
 
+def mark_dirty(db):
+    """Apply a change to ``db`` in memory and save it shortly.
+
+    The lookup indexes and response caches are refreshed right away; the
+    db.json write is shared with any other change in the next SAVE_DELAY
+    seconds (see flush_db).
+    """
+    global _db_cache, _dirty_db, _dirty_count, _save_timer
+    with _db_lock:
+        _db_cache = _dirty_db = db
+        _dirty_count += 1
+        _rebuild_indexes(db)
+        _body_cache.clear()
+        if _dirty_count >= SAVE_MAX_PENDING:
+            flush_db()
+        elif _save_timer is None:
+            _save_timer = threading.Timer(SAVE_DELAY, flush_db)
+            _save_timer.daemon = True
+            _save_timer.start()
+
+
+def flush_db():
+    """Write out changes queued by mark_dirty, if any."""
+    global _save_timer
+    with _db_lock:
+        if _save_timer is not None:
+            _save_timer.cancel()
+            _save_timer = None
+        if _dirty_db is not None:
+            save_db(_dirty_db)
+
+
+atexit.register(flush_db)
+
+
+def _open_events_log():
+    """Return the open events log descriptor, (re)opening it if the log
+    path changed or the file was removed by a compaction elsewhere."""
+    global _events_log_fd, _events_log_fd_path
+    path = _events_log_path()
+    if _events_log_fd is not None and (_events_log_fd_path != path
+                                       or os.fstat(_events_log_fd).st_nlink == 0):
+        _close_events_log()
+    if _events_log_fd is None:
+        _events_log_fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        _events_log_fd_path = path
+    return _events_log_fd
+
+
+def _close_events_log():
+    global _events_log_fd
+    if _events_log_fd is not None:
+        try:
+            os.close(_events_log_fd)
+        except OSError:
+            pass
+        _events_log_fd = None
+
+
+@_locked
+def append_event_record(db, record):
+    """Persist one event (or ``{"_del": id}`` tombstone) by appending to the events log.
+
+    ``db`` must already reflect the change; it is written out in full once
+    EVENTS_LOG_COMPACT_EVERY records have accumulated.
+    """
+    global _db_cache, _events_log_offset, _events_log_appends
+    try:
+        line = _json_dumps(record) + b'\n'
+        fd = _open_events_log()
+        view = memoryview(line)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+        end = os.lseek(fd, 0, os.SEEK_CUR)
+        # If someone else appended since our last read, leave the offset where
+        # it is so the next load_db() re-reads the log
+        if end - len(line) == _events_log_offset:
+            _events_log_offset = end
+        _events_log_appends += 1
+    except Exception as e:
+        logger.error(f"Failed to append to events log: {e}")
+        _close_events_log()
+        # Force a reload so the cache matches what is on disk
+        _db_cache = None
+        return
+    if _events_log_appends >= EVENTS_LOG_COMPACT_EVERY:
+        logger.info(f"Compacting events log after {_events_log_appends} records")
+        save_db(db)
+
+
+def _rebuild_indexes(db):
+    """Build the token/id/email/invite lookup dicts for ``db`` in one pass."""
+    global _indexed_db, _user_by_token, _user_by_id, _user_by_email, _users_by_username
+    global _users_by_household, _household_by_id, _household_by_invite
+    user_by_token = {}
+    user_by_id = {}
+    user_by_email = {}
+    users_by_username = {}
+    users_by_household = {}
+    for u in db['users']:
+        if u.get('token'):
+            user_by_token.setdefault(u['token'], u)
+        user_by_id.setdefault(u['id'], u)
+        if u.get('email'):
+            user_by_email.setdefault(u['email'].lower(), u)
+        if u.get('username'):
+            users_by_username.setdefault(u['username'], []).append(u)
+        users_by_household.setdefault(u['householdId'], []).append(u)
+    household_by_id = {}
+    household_by_invite = {}
+    for h in db['households']:
+        household_by_id.setdefault(h['id'], h)
+        for invite in h.get('inviteTokens', []):
+            household_by_invite.setdefault(invite, h)
+    _user_by_token, _user_by_id, _user_by_email = user_by_token, user_by_id, user_by_email
+    _users_by_username, _users_by_household = users_by_username, users_by_household
+    _household_by_id, _household_by_invite = household_by_id, household_by_invite
+    _indexed_db = db
+
+
+def _ensure_indexes(db):
+    if db is not _indexed_db:
+        _rebuild_indexes(db)
+
+
 def get_user_by_token(db, token):
     """Return the user dict matching the given token, or None."""
-    for u in db['users']:
-        if u.get('token') == token:
-            return u
-    return None
+    _ensure_indexes(db)
+    return _user_by_token.get(token)
+
+
+def get_user_by_id(db, user_id):
+    _ensure_indexes(db)
+    return _user_by_id.get(user_id)
+
+
+def get_user_by_email(db, email):
+    """Return the user registered with ``email`` (case-insensitive), or None."""
+    _ensure_indexes(db)
+    return _user_by_email.get(email.lower())
+
+
+def get_users_by_username(db, username):
+    _ensure_indexes(db)
+    return _users_by_username.get(username, [])
+
+
+def get_household_users(db, household_id):
+    _ensure_indexes(db)
+    return _users_by_household.get(household_id, [])
 
 
 def get_household(db, household_id):
-    for h in db['households']:
-        if h['id'] == household_id:
-            return h
-    return None
+    _ensure_indexes(db)
+    return _household_by_id.get(household_id)
+
+
+def get_household_by_invite(db, invite_token):
+    _ensure_indexes(db)
+    return _household_by_invite.get(invite_token)
+
+
+def _linked_username(db, household, invite_token):
+    """Username of whoever registered with ``invite_token``, or None."""
+    linked_id = household.get('inviteLinks', {}).get(invite_token)
+    if not linked_id:
+        return None
+    linked = get_user_by_id(db, linked_id)
+    return linked.get('username') if linked else None
+
+
+def _intern_type(event):
+    """Share one string per event type: a parsed db.json holds a separate copy
+    for every event, and POINTS_FOR_EVENT lookups on interned keys match by
+    identity."""
+    evt_type = event.get('type')
+    if isinstance(evt_type, str):
+        event['type'] = sys.intern(evt_type)
+
+
+def _ensure_event_index(db):
+    global _events_indexed_db, _events_by_household
+    if db is not _events_indexed_db:
+        by_household = {}
+        for e in db['events']:
+            by_household.setdefault(e.get('householdId'), {})[e['id']] = e
+            _intern_type(e)
+        _events_by_household = by_household
+        _events_by_day.clear()
+        _events_indexed_db = db
+
+
+def get_household_events(db, household_id):
+    """Return a household's events in insertion order."""
+    _ensure_event_index(db)
+    return _events_by_household.get(household_id, {}).values()
+
+
+def get_household_event(db, household_id, event_id):
+    _ensure_event_index(db)
+    return _events_by_household.get(household_id, {}).get(event_id)
+
+
+def get_household_events_on(db, household_id, day):
+    """Return a household's events on local day index ``day``, oldest first."""
+    _current_day()
+    _ensure_event_index(db)
+    by_day = _events_by_day.get(household_id)
+    if by_day is None:
+        by_day = {}
+        for e in _events_by_household.get(household_id, {}).values():
+            by_day.setdefault(_day_index(e.get('timestamp', 0), _utc_offset), []).append(e)
+        for day_events in by_day.values():
+            day_events.sort(key=_event_timestamp)
+        _events_by_day[household_id] = by_day
+    return by_day.get(day, [])
+
+
+def _event_timestamp(event):
+    return event.get('timestamp', 0)
 
 
 def _start_of_today():
@@ -172,118 +671,437 @@ def _start_of_today():
     return datetime.datetime(year=now.year, month=now.month, day=now.day)
 
 
+# A simple point system for each event type; anything else scores 0
+POINTS_FOR_EVENT = {
+    'feed_morning': 1,
+    'feed_evening': 1,
+    'walk': 1,
+    'walk_morning': 1,
+    'walk_afternoon': 1,
+    'walk_evening': 1,
+    'pee': 2,
+    'poop': 3,
+    'reward': 1,
+    'accident': -2,
+}
+
+
 def compute_points_for_event(event_type):
     """Define a simple point system for each event type."""
-    return {
-        'feed_morning': 1,
-        'feed_evening': 1,
-        'walk': 1,
-        'walk_morning': 1,
-        'walk_afternoon': 1,
-        'walk_evening': 1,
-        'pee': 2,
-        'poop': 3,
-        'reward': 1,
-        'accident': -2,
-    }.get(event_type, 0)
+    return POINTS_FOR_EVENT.get(event_type, 0)
 
 
 def _event_date(ts):
     return datetime.datetime.fromtimestamp(ts).date()
 
 
-def compute_scoreboard(db, household_id):
-    """Compute rich per-user stats and family totals for a household.
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
 
-    - Per-user: total points, weekly points (last 7 days), streak (consecutive
-      days with at least one scored event), and raw event counters.
-    - Family: total and weekly total (sum of members).
 
-    To avoid double-scoring, we deduplicate by (user, event_type, date): only
-    the first occurrence of a given type for that user per day yields points.
+def _day_index(ts, utc_offset):
+    """Local day number (days since 1970-01-01) of a timestamp.
+
+    Plain int arithmetic instead of _event_date's datetime round-trip. The
+    offset is sampled once per day, so events from before a DST change may
+    land an hour off around midnight.
     """
-    today = _start_of_today().date()
-    week_ago = today - datetime.timedelta(days=6)
-
-    # index users in this household
-    users = [u for u in db['users'] if u['householdId'] == household_id]
-    user_index = {u['id']: u for u in users}
-
-    # Prepare accumulators
-    per_user = {
-        u['id']: {
-            'totalPoints': 0,
-            'weeklyPoints': 0,
-            'eventsByDay': {},  # date -> list of events
-            'rawCounts': {},  # event_type -> count
-        }
-        for u in users
-    }
+    return int((ts + utc_offset) // 86400)
 
-    seen_for_points = set()  # (userId, event_type, date)
 
-    for event in db['events']:
-        if event['householdId'] != household_id:
-            continue
-        user_id = event.get('userId')
-        if user_id not in per_user:
-            continue
-        date = _event_date(event['timestamp'])
-        evt_type = event['type']
+def _date_to_day_index(date):
+    return date.toordinal() - _EPOCH_ORDINAL
 
-        # accumulate raw counts and history
-        info = per_user[user_id]
-        info['rawCounts'][evt_type] = info['rawCounts'].get(evt_type, 0) + 1
-        info['eventsByDay'].setdefault(date, []).append(event)
 
-        # de-duplicate for scoring
-        key = (user_id, evt_type, date)
-        if key in seen_for_points:
-            continue
-        seen_for_points.add(key)
+def _current_day():
+    """Return today's local day index, resetting the day-keyed caches at midnight."""
+    global _today_index, _utc_offset
+    utc_offset = time.localtime().tm_gmtoff
+    today = _day_index(time.time(), utc_offset)
+    if today != _today_index:
+        _today_index, _utc_offset = today, utc_offset
+        _events_by_day.clear()
+        _scoreboard_cache.clear()
+        _body_cache.clear()
+    return today
+
+
+# Small int per event type, assigned on first sight, so the per-user
+# (type, day) dedupe keys can be packed into one int (see _seen_key)
+_event_type_ids = {}
+
+
+def _seen_key(evt_type, day):
+    type_id = _event_type_ids.get(evt_type)
+    if type_id is None:
+        type_id = _event_type_ids.setdefault(evt_type, len(_event_type_ids))
+    return (type_id << 32) | (day & 0xFFFFFFFF)
+
+
+def _scoreboard_apply(state, event, sign, today):
+    """Add (sign=1) or remove (sign=-1) one event from a household's state.
+
+    ``state`` maps user id -> running totals. Points are de-duplicated by
+    (user, event_type, date): only the first occurrence of a given type for
+    that user per day yields points, so a Counter per user tracks how many
+    events share each (type, day) key, packed by _seen_key. ``today`` and all
+    days are local day indexes (see _day_index).
+    """
+    day = _day_index(event['timestamp'], _utc_offset)
+    evt_type = event['type']
+    info = state.setdefault(event.get('userId'), {
+        'totalPoints': 0,
+        'weeklyPoints': 0,
+        'eventsByDay': Counter(),  # day index -> number of events
+        'seen': Counter(),  # _seen_key(event_type, day index) -> number of events
+        'streak': None,  # consecutive active days up to today, None until computed
+    })
+
+    events_by_day = info['eventsByDay']
+    events_by_day[day] += sign
+    if events_by_day[day] <= 0:
+        del events_by_day[day]
+        info['streak'] = None
+    elif sign > 0 and events_by_day[day] == 1:
+        info['streak'] = None
+
+    key = _seen_key(evt_type, day)
+    seen = info['seen']
+    seen[key] += sign
+    if seen[key] <= 0:
+        del seen[key]
+    # Points only change when the first event of a key appears or the last
+    # one disappears
+    if (sign > 0 and seen.get(key) != 1) or (sign < 0 and key in seen):
+        return
+
+    pts = POINTS_FOR_EVENT.get(evt_type, 0) * sign
+    if pts == 0:
+        return
+    info['totalPoints'] += pts
+    if today - 6 <= day <= today:
+        info['weeklyPoints'] += pts
+
+
+def _scoreboard_state(db, household_id):
+    """Return the cached scoreboard state for a household, building it if needed.
+
+    The cache belongs to one db object and one day: loading a different db
+    or crossing midnight (which moves the weekly window) starts afresh.
+    """
+    global _scoreboard_db
+    today = _current_day()
+    if db is not _scoreboard_db:
+        _scoreboard_cache.clear()
+        _scoreboard_db = db
+
+    state = _scoreboard_cache.get(household_id)
+    if state is None:
+        state = _scoreboard_build(get_household_events(db, household_id), today, _utc_offset)
+        _scoreboard_cache[household_id] = state
+    return state
+
+
+def _scoreboard_build(events, today, utc_offset):
+    """Build a household state from its events in one batch pass.
 
-        pts = compute_points_for_event(evt_type)
-        if pts == 0:
+    Same result as calling _scoreboard_apply(state, event, 1, today) per
+    event, but with the lookups hoisted into locals and no delete branches,
+    since this pass runs over the full history.
+    """
+    state = {}
+    week_ago = today - 6
+    points = POINTS_FOR_EVENT.get
+    type_ids = _event_type_ids
+    for event in events:
+        day = int((event['timestamp'] + utc_offset) // 86400)
+        evt_type = event['type']
+        info = state.get(event.get('userId'))
+        if info is None:
+            info = state[event.get('userId')] = {
+                'totalPoints': 0, 'weeklyPoints': 0, 'eventsByDay': Counter(), 'seen': Counter(),
+                'streak': None,
+            }
+        info['eventsByDay'][day] += 1
+        seen = info['seen']
+        type_id = type_ids.get(evt_type)
+        if type_id is None:
+            type_id = type_ids.setdefault(evt_type, len(type_ids))
+        key = (type_id << 32) | (day & 0xFFFFFFFF)
+        seen[key] += 1
+        if seen[key] != 1:
             continue
-        info['totalPoints'] += pts
-        if week_ago <= date <= today:
-            info['weeklyPoints'] += pts
-
-    # compute streaks
-    for user_id, info in per_user.items():
-        streak = 0
-        day = today
-        while True:
-            if day in info['eventsByDay']:
-                streak += 1
-                day = day - datetime.timedelta(days=1)
-            else:
-                break
-        info['streak'] = streak
+        pts = points(evt_type, 0)
+        if pts:
+            info['totalPoints'] += pts
+            if week_ago <= day <= today:
+                info['weeklyPoints'] += pts
+    return state
+
+
+def _scoreboard_event_changed(db, event, sign):
+    """Write-through update of the cached scoreboard for an added/removed event."""
+    if db is _scoreboard_db:
+        state = _scoreboard_cache.get(event['householdId'])
+        if state is not None:
+            _scoreboard_apply(state, event, sign, _today_index)
+
+
+def _scoreboard_invalidate(household_id):
+    _scoreboard_cache.pop(household_id, None)
+
+
+def _find_event(db, household_id, event_id):
+    """Look up an event by id, checking every household when it is unknown."""
+    if household_id is not None:
+        return get_household_event(db, household_id, event_id)
+    _ensure_event_index(db)
+    return next((bucket[event_id] for bucket in _events_by_household.values()
+                 if event_id in bucket), None)
+
+
+def _add_event_in_memory(db, event):
+    _intern_type(event)
+    db['events'].append(event)
+    _ensure_event_index(db)
+    _events_by_household.setdefault(event['householdId'], {})[event['id']] = event
+    by_day = _events_by_day.get(event['householdId'])
+    if by_day is not None:
+        day_events = by_day.setdefault(_day_index(event['timestamp'], _utc_offset), [])
+        # New events are nearly always the latest, so look for the slot from
+        # the end (bisect's key= needs Python 3.10)
+        ts = _event_timestamp(event)
+        i = len(day_events)
+        while i and _event_timestamp(day_events[i - 1]) > ts:
+            i -= 1
+        day_events.insert(i, event)
+    _scoreboard_event_changed(db, event, 1)
+    _body_cache.pop(event['householdId'], None)
+
+
+def _remove_event_in_memory(db, event):
+    db['events'].remove(event)
+    _ensure_event_index(db)
+    _events_by_household.get(event['householdId'], {}).pop(event['id'], None)
+    by_day = _events_by_day.get(event['householdId'])
+    if by_day is not None:
+        day_events = by_day.get(_day_index(event['timestamp'], _utc_offset), [])
+        if event in day_events:
+            day_events.remove(event)
+    _scoreboard_event_changed(db, event, -1)
+    _body_cache.pop(event['householdId'], None)
+
+
+def add_event(db, event):
+    """Record a new event in memory and append it to the events log."""
+    _add_event_in_memory(db, event)
+    append_event_record(db, event)
+
+
+def remove_event(db, event):
+    """Remove an event from memory and append a tombstone to the events log."""
+    _remove_event_in_memory(db, event)
+    append_event_record(db, {'_del': event['id'], 'householdId': event['householdId']})
+
+
+def clear_household_events(db, household_id):
+    """Delete every event of a household and queue a save. Returns the
+    number removed."""
+    _ensure_event_index(db)
+    removed = len(_events_by_household.pop(household_id, {}))
+    _events_by_day.pop(household_id, None)
+    if removed:
+        db['events'] = [e for e in db['events'] if e['householdId'] != household_id]
+    _scoreboard_invalidate(household_id)
+    mark_dirty(db)
+    return removed
+
+
+def _cached_body(db, household_id, key, build):
+    """Return ``build()`` encoded as JSON, reusing the bytes until the
+    household's events change, the db is saved or the day rolls over."""
+    global _body_cache_db
+    _current_day()
+    if db is not _body_cache_db:
+        _body_cache.clear()
+        _body_cache_db = db
+    entries = _body_cache.setdefault(household_id, {})
+    body = entries.get(key)
+    if body is None:
+        body = entries[key] = _json_dumps(build())
+    return body
+
+
+def get_scores_body(db, household_id):
+    """Return the encoded /api/scores response for a household."""
+    def build_scores():
+        scoreboard, family_total, family_weekly_total = compute_scoreboard(db, household_id)
+        return {
+            'scoreboard': scoreboard,
+            'familyTotal': family_total,
+            'familyWeeklyTotal': family_weekly_total
+        }
+
+    return _cached_body(db, household_id, 'scores', build_scores)
+
+
+def _warm_scores(household_id):
+    with _db_lock:
+        try:
+            get_scores_body(load_db(), household_id)
+        except Exception as e:
+            logger.error(f"Failed to precompute scores: {e}")
+
+
+def compute_scoreboard(db, household_id):
+    """Compute rich per-user stats and family totals for a household.
+
+    - Per-user: total points, weekly points (last 7 days), streak (consecutive
+      days with at least one scored event), and raw event counters.
+    - Family: total and weekly total (sum of members).
+
+    The per-user totals are maintained incrementally (see _scoreboard_apply),
+    so this is a snapshot of the cached state plus the streak walk and sort.
+    """
+    state = _scoreboard_state(db, household_id)
+    today = _today_index
 
-    # Build scoreboard list
     scoreboard = []
-    for user_id, info in per_user.items():
-        user = user_index[user_id]
+    family_total = family_weekly_total = 0
+    for user in get_household_users(db, household_id):
+        info = state.get(user['id'])
+        total = weekly = streak = 0
+        if info is not None:
+            total = info['totalPoints']
+            weekly = info['weeklyPoints']
+            family_total += total
+            family_weekly_total += weekly
+            # Only recounted after the set of active days changes (or at
+            # midnight, which drops the whole state)
+            streak = info['streak']
+            if streak is None:
+                streak = 0
+                day = today
+                while day in info['eventsByDay']:
+                    streak += 1
+                    day -= 1
+                info['streak'] = streak
         scoreboard.append({
-            'userId': user_id,
+            'userId': user['id'],
             'username': user.get('username') or user.get('email'),
             'email': user.get('email'),
-            'points': info['totalPoints'],
-            'totalPoints': info['totalPoints'],
-            'weeklyPoints': info['weeklyPoints'],
-            'streak': info.get('streak', 0)
+            'points': total,
+            'totalPoints': total,
+            'weeklyPoints': weekly,
+            'streak': streak
         })
 
     scoreboard.sort(key=lambda x: (-x['totalPoints'], x['username'] or ''))
-    family_total = sum(p['totalPoints'] for p in scoreboard)
-    family_weekly_total = sum(p['weeklyPoints'] for p in scoreboard)
     return scoreboard, family_total, family_weekly_total
 
 
+def _load_static(abs_path, st):
+    mtime_ns = st.st_mtime_ns
+    last_modified = formatdate(mtime_ns // 1_000_000_000, usegmt=True)
+    if st.st_size > STATIC_CACHE_MAX_SIZE:
+        entry = (mtime_ns, None, None, 'W/"%x-%x"' % (mtime_ns, st.st_size),
+                 last_modified, st.st_size)
+        _store_static(abs_path, entry)
+        return entry
+    with open(abs_path, 'rb') as fh:
+        body = fh.read()
+    gz = None
+    if os.path.splitext(abs_path)[1].lower() in _STATIC_GZIP_EXTS:
+        gz = gzip.compress(body, 9)
+        if len(gz) >= len(body):
+            gz = None
+    entry = (mtime_ns, body, gz, '"%s"' % hashlib.md5(body).hexdigest(),
+             last_modified, len(body))
+    _store_static(abs_path, entry)
+    return entry
+
+
+def _store_static(abs_path, entry):
+    with _static_lock:
+        _static_cache[abs_path] = entry
+        _static_cache.move_to_end(abs_path)
+        while len(_static_cache) > STATIC_CACHE_MAX_ENTRIES:
+            _static_cache.popitem(last=False)
+
+
+def _not_modified_since(if_modified_since, mtime_ns):
+    """Whether a file last modified at ``mtime_ns`` is unchanged since the
+    HTTP date in an If-Modified-Since header."""
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return mtime_ns // 1_000_000_000 <= since
+
+
+@lru_cache(maxsize=256)
+def _client_path(url_path):
+    """Absolute path under CLIENT_DIR for a URL path, or None if it points
+    outside of it. Pure string work, so safe to cache."""
+    rel_path = url_path.lstrip('/') or 'index.html'
+    abs_path = os.path.normpath(os.path.join(CLIENT_DIR, rel_path))
+    # prevent directory traversal
+    if abs_path != CLIENT_DIR and not abs_path.startswith(_CLIENT_ABS):
+        return None
+    return abs_path
+
+
+def _static_path(url_path):
+    """Map a URL path to ``(absolute path, extension)`` of a file in
+    CLIENT_DIR, or None if it points outside of it."""
+    abs_path = _client_path(url_path)
+    if abs_path is None:
+        return None
+    # checked per request: directories can appear or go away at runtime
+    if os.path.isdir(abs_path):
+        abs_path = os.path.join(abs_path, 'index.html')
+    return abs_path, os.path.splitext(abs_path)[1].lower()
+
+
+def get_static_file(abs_path):
+    """Return the cached ``(mtime_ns, body, gzip_body, etag, last_modified,
+    size)`` of a client file, or None if it does not exist."""
+    try:
+        st = os.stat(abs_path)
+    except OSError:
+        with _static_lock:
+            _static_cache.pop(abs_path, None)
+        return None
+    with _static_lock:
+        entry = _static_cache.get(abs_path)
+        if entry is not None and entry[0] == st.st_mtime_ns:
+            _static_cache.move_to_end(abs_path)
+            return entry
+    # read and compress outside the lock
+    try:
+        return _load_static(abs_path, st)
+    except OSError:  # e.g. a directory
+        return None
+
+
+def preload_static_files():
+    """Read and compress every client file up front."""
+    for root, _dirs, files in os.walk(CLIENT_DIR):
+        for name in files:
+            get_static_file(os.path.join(root, name))
+
+
 class AppHandler(SimpleHTTPRequestHandler):
     """Custom handler that routes API calls and serves the client app."""
 
+    # Keep connections open between requests (every response sends a
+    # Content-Length so the client knows where it ends)
+    protocol_version = 'HTTP/1.1'
+    # Drop clients that stall mid-request or stop reading (also ends idle
+    # keep-alive connections)
+    timeout = 30
+
     def do_OPTIONS(self):
         # Handle CORS preflight requests
         self.send_response(204)
@@ -292,11 +1110,16 @@ class AppHandler(SimpleHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
         self.end_headers()
 
-    def _send_json(self, data, status=200):
+    def _send_json(self, body, status=200):
+        # ``body`` is already-encoded JSON (see _handle_api)
         try:
-            body = json.dumps(data, ensure_ascii=False).encode('utf-8')
             self.send_response(status)
             self.send_header('Content-Type', 'application/json; charset=utf-8')
+            if len(body) > JSON_GZIP_MIN_SIZE:
+                self.send_header('Vary', 'Accept-Encoding')
+                if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                    body = gzip.compress(body, 5)
+                    self.send_header('Content-Encoding', 'gzip')
             self.send_header('Content-Length', str(len(body)))
             self.send_header('Access-Control-Allow-Origin', '*')
             self.end_headers()
@@ -321,167 +1144,181 @@ class AppHandler(SimpleHTTPRequestHandler):
         return token
 
     def _read_json(self):
-        content_length = int(self.headers.get('Content-Length', 0))
-        if not content_length:
+        if not self._raw_body:
             return None
-        raw = self.rfile.read(content_length)
         try:
-            return json.loads(raw.decode('utf-8'))
+            return _json_loads(self._raw_body)
         except Exception:
             return None
 
+    def _send_empty(self, status):
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
     def _handle_api(self):
+        # Socket I/O happens outside the db lock, so a slow client only holds
+        # up its own thread. The whole body is read even if the handler
+        # ignores it: anything left in the stream would be parsed as the next
+        # request on this keep-alive connection.
+        content_length = int(self.headers.get('Content-Length', 0))
+        self._raw_body = self.rfile.read(content_length) if content_length else b''
+        with _db_lock:
+            data, status = self._route_api()
+            # encoded under the lock: ``data`` may share lists with the db
+            body = data if isinstance(data, bytes) else _json_dumps(data)
+        self._send_json(body, status)
+
+    def _route_api(self):
+        """Dispatch to an _api_* handler; each returns (data, status), where
+        data is a dict or an already-encoded body (see _cached_body)."""
         parsed = urlparse(self.path)
         path = parsed.path
         # Only log important operations, not every GET request
         if self.command != 'GET' or path not in ['/api/today', '/api/history', '/api/scores']:
             logger.info(f"API Request: {self.command} {path}")
         db = load_db()
+        handler = _API_ROUTES.get((self.command, path))
+        if handler is None:
+            handler = next((h for method, prefix, h in _API_PREFIX_ROUTES
+                            if self.command == method and path.startswith(prefix)), None)
+        if handler is not None:
+            return handler(self, db, parsed)
+        # Unknown API path
+        return {'error': 'unknown endpoint'}, 404
+
+    def _api_register(self, db, parsed):
         # Register
-        if path == '/api/register' and self.command == 'POST':
-            data = self._read_json()
-            logger.info(f"POST /api/register - New registration attempt")
-            if not data or not data.get('email') or not data.get('password'):
-                logger.warning("Registration failed: missing email or password")
-                return self._send_json({'error': 'email and password required'}, 400)
-            email = data['email'].strip().lower()
-            display_name = (data.get('username') or '').strip()
-            password = data['password']
-            invite_token = data.get('inviteToken')
-            logger.info(f"Registering user: {email}, invite: {bool(invite_token)}")
-            # Check if email already exists
-            if any(u.get('email', '').lower() == email for u in db['users']):
-                return self._send_json({'error': 'email already exists'}, 400)
-            # Determine household
-            household_id = None
-            if invite_token:
-                # find household by invite token
-                for h in db['households']:
-                    if invite_token in h.get('inviteTokens', []):
-                        household_id = h['id']
-                        break
-                if household_id is None:
-                    return self._send_json({'error': 'invalid invite token'}, 400)
-            # create household if not provided (first user becomes admin)
-            if not household_id:
-                household_id = uuid.uuid4().hex
-                # default dog name empty
-                new_invite = uuid.uuid4().hex
-                db['households'].append({
-                    'id': household_id,
-                    'dogName': '',
-                    'inviteTokens': [new_invite],
-                    'inviteLinks': {},
-                    'dogAgeMonths': 0,
-                    'dogPhotoUrl': ''
-                })
-            # create user
-            user_id = uuid.uuid4().hex
-            token = uuid.uuid4().hex
-            db['users'].append({
-                'id': user_id,
-                'username': display_name or email.split('@')[0],
-                'email': email,
-                'password': password,
-                'householdId': household_id,
-                'token': token,
-                'isAdmin': not invite_token  # creator without invite is admin
+        data = self._read_json()
+        logger.info(f"POST /api/register - New registration attempt")
+        if not data or not data.get('email') or not data.get('password'):
+            logger.warning("Registration failed: missing email or password")
+            return {'error': 'email and password required'}, 400
+        email = data['email'].strip().lower()
+        display_name = (data.get('username') or '').strip()
+        password = data['password']
+        invite_token = data.get('inviteToken')
+        logger.info(f"Registering user: {email}, invite: {bool(invite_token)}")
+        # Check if email already exists
+        if get_user_by_email(db, email) is not None:
+            return {'error': 'email already exists'}, 400
+        # Determine household
+        household_id = None
+        if invite_token:
+            # find household by invite token
+            h = get_household_by_invite(db, invite_token)
+            if h is None:
+                return {'error': 'invalid invite token'}, 400
+            household_id = h['id']
+        # create household if not provided (first user becomes admin)
+        if not household_id:
+            household_id = secrets.token_hex(16)
+            # default dog name empty
+            new_invite = secrets.token_hex(16)
+            db['households'].append({
+                'id': household_id,
+                'dogName': '',
+                'inviteTokens': [new_invite],
+                'inviteLinks': {},
+                'dogAgeMonths': 0,
+                'dogPhotoUrl': ''
             })
+        # create user
+        user_id = secrets.token_hex(16)
+        token = secrets.token_hex(16)
+        db['users'].append({
+            'id': user_id,
+            'username': display_name or email.split('@')[0],
+            'email': email,
+            'password': password,
+            'householdId': household_id,
+            'token': token,
+            'isAdmin': not invite_token  # creator without invite is admin
+        })
 
-            # record invite usage
-            if invite_token:
-                h = get_household(db, household_id)
-                if h is not None:
-                    h.setdefault('inviteLinks', {})[invite_token] = user_id
-            save_db(db)
+        # record invite usage
+        if invite_token:
             h = get_household(db, household_id)
-            scoreboard, family_total, family_weekly_total = compute_scoreboard(db, household_id)
-            # build invite tokens with linked usernames
-            invite_tokens = []
-            for t in h.get('inviteTokens', []):
-                linked = None
-                linked_id = h.get('inviteLinks', {}).get(t)
-                if linked_id:
-                    for u in db['users']:
-                        if u['id'] == linked_id:
-                            linked = u.get('username')
-                            break
-                invite_tokens.append({'token': t, 'linkedUsername': linked})
-
-            return self._send_json({
-                'token': token,
-                'userId': user_id,
-                'username': display_name or email.split('@')[0],
-                'householdId': household_id,
-                'dogName': h['dogName'],
-                'dogAgeMonths': h.get('dogAgeMonths'),
-                'dogPhotoUrl': h.get('dogPhotoUrl'),
-                'inviteTokens': invite_tokens,
-                'scoreboard': scoreboard,
-                'familyTotal': family_total,
-                'familyWeeklyTotal': family_weekly_total
-            }, 200)
+            if h is not None:
+                h.setdefault('inviteLinks', {})[invite_token] = user_id
+        save_db(db)
+        h = get_household(db, household_id)
+        scoreboard, family_total, family_weekly_total = compute_scoreboard(db, household_id)
+        # build invite tokens with linked usernames
+        invite_tokens = [
+            {'token': t, 'linkedUsername': _linked_username(db, h, t)}
+            for t in h.get('inviteTokens', [])
+        ]
+
+        return {
+            'token': token,
+            'userId': user_id,
+            'username': display_name or email.split('@')[0],
+            'householdId': household_id,
+            'dogName': h['dogName'],
+            'dogAgeMonths': h.get('dogAgeMonths'),
+            'dogPhotoUrl': h.get('dogPhotoUrl'),
+            'inviteTokens': invite_tokens,
+            'scoreboard': scoreboard,
+            'familyTotal': family_total,
+            'familyWeeklyTotal': family_weekly_total
+        }, 200
+
+    def _api_login(self, db, parsed):
         # Login
-        if path == '/api/login' and self.command == 'POST':
-            data = self._read_json()
-            logger.info(f"POST /api/login - Login attempt")
-            if not data or not data.get('email') or not data.get('password'):
-                logger.warning("Login failed: missing credentials")
-                return self._send_json({'error': 'email and password required'}, 400)
-            email = data['email'].strip().lower()
-            password = data['password']
-            logger.info(f"Login attempt for: {email}")
-            for u in db['users']:
-                # support both legacy username and new email login
-                if (
-                    (u.get('email', '').lower() == email or u.get('username') == email)
-                    and u['password'] == password
-                ):
-                    # return token and household info
-                    logger.info(f"Login successful: {u['username']} (household: {u['householdId']})")
-                    h = get_household(db, u['householdId'])
-                    scoreboard, family_total, family_weekly_total = compute_scoreboard(db, u['householdId'])
-                    return self._send_json({
-                        'token': u['token'],
-                        'userId': u['id'],
-                        'username': u['username'],
-                        'householdId': u['householdId'],
-                        'dogName': h['dogName'],
-                        'dogAgeMonths': h.get('dogAgeMonths'),
-                        'dogPhotoUrl': h.get('dogPhotoUrl'),
-                        'inviteTokens': [
-                            {'token': t, 'linkedUsername': (h.get('inviteLinks', {}).get(t) and next((x.get('username') for x in db['users'] if x['id'] == h.get('inviteLinks', {}).get(t)), None))}
-                            for t in h.get('inviteTokens', [])
-                        ],
-                        'scoreboard': scoreboard,
-                        'familyTotal': family_total,
-                        'familyWeeklyTotal': family_weekly_total,
-                        'isAdmin': u.get('isAdmin', False)
-                    }, 200)
-            logger.warning(f"Login failed: invalid credentials for {email}")
-            return self._send_json({'error': 'invalid credentials'}, 401)
+        data = self._read_json()
+        logger.info(f"POST /api/login - Login attempt")
+        if not data or not data.get('email') or not data.get('password'):
+            logger.warning("Login failed: missing credentials")
+            return {'error': 'email and password required'}, 400
+        email = data['email'].strip().lower()
+        password = data['password']
+        logger.info(f"Login attempt for: {email}")
+        # support both legacy username and new email login
+        by_email = get_user_by_email(db, email)
+        candidates = ([by_email] if by_email else []) + get_users_by_username(db, email)
+        for u in candidates:
+            if u['password'] == password:
+                # return token and household info
+                logger.info(f"Login successful: {u['username']} (household: {u['householdId']})")
+                h = get_household(db, u['householdId'])
+                scoreboard, family_total, family_weekly_total = compute_scoreboard(db, u['householdId'])
+                return {
+                    'token': u['token'],
+                    'userId': u['id'],
+                    'username': u['username'],
+                    'householdId': u['householdId'],
+                    'dogName': h['dogName'],
+                    'dogAgeMonths': h.get('dogAgeMonths'),
+                    'dogPhotoUrl': h.get('dogPhotoUrl'),
+                    'inviteTokens': [
+                        {'token': t, 'linkedUsername': _linked_username(db, h, t)}
+                        for t in h.get('inviteTokens', [])
+                    ],
+                    'scoreboard': scoreboard,
+                    'familyTotal': family_total,
+                    'familyWeeklyTotal': family_weekly_total,
+                    'isAdmin': u.get('isAdmin', False)
+                }, 200
+        logger.warning(f"Login failed: invalid credentials for {email}")
+        return {'error': 'invalid credentials'}, 401
+
+    def _api_user(self, db, parsed):
         # Fetch user info
-        if path == '/api/user' and self.command == 'GET':
-            token = self._get_auth_token()
-            if not token:
-                return self._send_json({'error': 'missing token'}, 401)
-            user = get_user_by_token(db, token)
-            if not user:
-                return self._send_json({'error': 'invalid token'}, 401)
+        token = self._get_auth_token()
+        if not token:
+            return {'error': 'missing token'}, 401
+        user = get_user_by_token(db, token)
+        if not user:
+            return {'error': 'invalid token'}, 401
+        def build_user_info():
             h = get_household(db, user['householdId'])
             scoreboard, family_total, family_weekly_total = compute_scoreboard(db, user['householdId'])
-            invite_tokens = []
-            for t in h.get('inviteTokens', []):
-                linked = None
-                linked_id = h.get('inviteLinks', {}).get(t)
-                if linked_id:
-                    for u in db['users']:
-                        if u['id'] == linked_id:
-                            linked = u.get('username')
-                            break
-                invite_tokens.append({'token': t, 'linkedUsername': linked})
-
-            return self._send_json({
+            invite_tokens = [
+                {'token': t, 'linkedUsername': _linked_username(db, h, t)}
+                for t in h.get('inviteTokens', [])
+            ]
+            return {
                 'userId': user['id'],
                 'username': user['username'],
                 'email': user.get('email'),
@@ -494,186 +1331,179 @@ class AppHandler(SimpleHTTPRequestHandler):
                 'familyTotal': family_total,
                 'familyWeeklyTotal': family_weekly_total,
                 'isAdmin': user.get('isAdmin', False)
-            }, 200)
+            }
+
+        return _cached_body(db, user['householdId'], ('user', user['id']), build_user_info), 200
+
+    def _api_dog(self, db, parsed):
         # Update dog name
-        if path == '/api/dog' and self.command == 'POST':
-            token = self._get_auth_token()
-            if not token:
-                return self._send_json({'error': 'missing token'}, 401)
-            user = get_user_by_token(db, token)
-            if not user:
-                return self._send_json({'error': 'invalid token'}, 401)
-            # Only household managers (admins) can edit the dog / household settings
-            if not user.get('isAdmin'):
-                return self._send_json({'error': 'manager only'}, 403)
-            data = self._read_json()
-            if not data or not data.get('dogName'):
-                return self._send_json({'error': 'dogName required'}, 400)
-            dog_name = data['dogName']
-            h = get_household(db, user['householdId'])
-            h['dogName'] = dog_name
-            # optional extra profile fields
-            if 'dogAgeMonths' in data:
-                h['dogAgeMonths'] = data['dogAgeMonths']
-            # support receiving base64-encoded uploaded image
-            if data.get('dogPhotoBase64'):
-                try:
-                    uploads_dir = os.path.join(CLIENT_DIR, 'uploads')
-                    os.makedirs(uploads_dir, exist_ok=True)
-                    import base64
-                    b64 = data['dogPhotoBase64']
-                    imgdata = base64.b64decode(b64)
-                    fname = f"{user['householdId']}_{int(datetime.datetime.now().timestamp())}.jpg"
-                    fpath = os.path.join(uploads_dir, fname)
-                    with open(fpath, 'wb') as fh:
-                        fh.write(imgdata)
-                    # store relative URL path for client (served from client directory)
-                    h['dogPhotoUrl'] = f"/uploads/{fname}"
-                except Exception as e:
-                    logger.error(f"Failed to save uploaded dog photo: {e}")
-            elif 'dogPhotoUrl' in data:
-                h['dogPhotoUrl'] = data['dogPhotoUrl']
-            save_db(db)
-            scoreboard, family_total, family_weekly_total = compute_scoreboard(db, user['householdId'])
-            return self._send_json({
-                'success': True,
-                'dogName': dog_name,
-                'dogAgeMonths': h.get('dogAgeMonths'),
-                'dogPhotoUrl': h.get('dogPhotoUrl'),
-                'scoreboard': scoreboard,
-                'familyTotal': family_total,
-                'familyWeeklyTotal': family_weekly_total
-            }, 200)
+        token = self._get_auth_token()
+        if not token:
+            return {'error': 'missing token'}, 401
+        user = get_user_by_token(db, token)
+        if not user:
+            return {'error': 'invalid token'}, 401
+        # Only household managers (admins) can edit the dog / household settings
+        if not user.get('isAdmin'):
+            return {'error': 'manager only'}, 403
+        data = self._read_json()
+        if not data or not data.get('dogName'):
+            return {'error': 'dogName required'}, 400
+        dog_name = data['dogName']
+        h = get_household(db, user['householdId'])
+        h['dogName'] = dog_name
+        # optional extra profile fields
+        if 'dogAgeMonths' in data:
+            h['dogAgeMonths'] = data['dogAgeMonths']
+        # support receiving base64-encoded uploaded image
+        if data.get('dogPhotoBase64'):
+            try:
+                uploads_dir = os.path.join(CLIENT_DIR, 'uploads')
+                os.makedirs(uploads_dir, exist_ok=True)
+                import base64
+                b64 = data['dogPhotoBase64']
+                imgdata = base64.b64decode(b64)
+                fname = f"{user['householdId']}_{int(datetime.datetime.now().timestamp())}.jpg"
+                fpath = os.path.join(uploads_dir, fname)
+                with open(fpath, 'wb') as fh:
+                    fh.write(imgdata)
+                # store relative URL path for client (served from client directory)
+                h['dogPhotoUrl'] = f"/uploads/{fname}"
+            except Exception as e:
+                logger.error(f"Failed to save uploaded dog photo: {e}")
+        elif 'dogPhotoUrl' in data:
+            h['dogPhotoUrl'] = data['dogPhotoUrl']
+        mark_dirty(db)
+        scoreboard, family_total, family_weekly_total = compute_scoreboard(db, user['householdId'])
+        return {
+            'success': True,
+            'dogName': dog_name,
+            'dogAgeMonths': h.get('dogAgeMonths'),
+            'dogPhotoUrl': h.get('dogPhotoUrl'),
+            'scoreboard': scoreboard,
+            'familyTotal': family_total,
+            'familyWeeklyTotal': family_weekly_total
+        }, 200
+
+    def _api_add_event(self, db, parsed):
         # Record event
-        if path == '/api/events' and self.command == 'POST':
-            token = self._get_auth_token()
-            if not token:
-                logger.warning("POST /api/events - Missing token")
-                return self._send_json({'error': 'missing token'}, 401)
-            user = get_user_by_token(db, token)
-            if not user:
-                logger.warning("POST /api/events - Invalid token")
-                return self._send_json({'error': 'invalid token'}, 401)
-            data = self._read_json()
-            if not data or not data.get('type'):
-                logger.warning(f"POST /api/events - Missing event type (user: {user['username']})")
-                return self._send_json({'error': 'type required'}, 400)
-            event_type = data['type']
-            # If client sends generic 'walk', map to a time-of-day specific walk
-            if event_type == 'walk':
-                now = datetime.datetime.now()
-                hour = now.hour
-                # morning: 04:00-11:59, afternoon: 12:00-17:59, evening: 18:00-03:59
-                if 4 <= hour < 12:
-                    event_type = 'walk_morning'
-                elif 12 <= hour < 18:
-                    event_type = 'walk_afternoon'
-                else:
-                    event_type = 'walk_evening'
-
-            event_id = uuid.uuid4().hex
-            timestamp = int(datetime.datetime.now().timestamp())
-            logger.info(f"POST /api/events - User {user['username']} added event: {event_type}")
-            db['events'].append({
-                'id': event_id,
-                'householdId': user['householdId'],
-                'type': event_type,
-                'timestamp': timestamp,
-                'userId': user['id']
-            })
-            save_db(db)
-            scoreboard, family_total, family_weekly_total = compute_scoreboard(db, user['householdId'])
-            logger.info(f"Event recorded: {event_type}, new family total: {family_total}")
-            return self._send_json({
-                'success': True,
-                'eventId': event_id,
-                'scoreboard': scoreboard,
-                'familyTotal': family_total,
-                'familyWeeklyTotal': family_weekly_total
-            }, 200)
+        token = self._get_auth_token()
+        if not token:
+            logger.warning("POST /api/events - Missing token")
+            return {'error': 'missing token'}, 401
+        user = get_user_by_token(db, token)
+        if not user:
+            logger.warning("POST /api/events - Invalid token")
+            return {'error': 'invalid token'}, 401
+        data = self._read_json()
+        if not data or not data.get('type'):
+            logger.warning(f"POST /api/events - Missing event type (user: {user['username']})")
+            return {'error': 'type required'}, 400
+        event_type = data['type']
+        now = datetime.datetime.now()
+        # If client sends generic 'walk', map to a time-of-day specific walk
+        if event_type == 'walk':
+            hour = now.hour
+            # morning: 04:00-11:59, afternoon: 12:00-17:59, evening: 18:00-03:59
+            if 4 <= hour < 12:
+                event_type = 'walk_morning'
+            elif 12 <= hour < 18:
+                event_type = 'walk_afternoon'
+            else:
+                event_type = 'walk_evening'
+
+        event_id = secrets.token_hex(16)
+        timestamp = int(now.timestamp())
+        logger.info(f"POST /api/events - User {user['username']} added event: {event_type}")
+        event = {
+            'id': event_id,
+            'householdId': user['householdId'],
+            'type': event_type,
+            'timestamp': timestamp,
+            'userId': user['id']
+        }
+        add_event(db, event)
+        logger.info(f"Event recorded: {event_type}")
+        # The client fetches /api/scores next; have it ready by then
+        _background.submit(_warm_scores, user['householdId'])
+        return {'success': True, 'eventId': event_id}, 200
+
+    def _api_invite(self, db, parsed):
         # Create invite token
-        if path == '/api/invite' and self.command == 'POST':
-            token = self._get_auth_token()
-            if not token:
-                return self._send_json({'error': 'missing token'}, 401)
-            user = get_user_by_token(db, token)
-            if not user:
-                return self._send_json({'error': 'invalid token'}, 401)
-            if not user.get('isAdmin'):
-                return self._send_json({'error': 'only admin can manage invites'}, 403)
-            h = get_household(db, user['householdId'])
-            new_token = uuid.uuid4().hex
-            h.setdefault('inviteTokens', []).append(new_token)
-            h.setdefault('inviteLinks', {})
-            save_db(db)
-            return self._send_json({
-                'inviteToken': new_token,
-                'inviteTokens': [
-                    {'token': t, 'linkedUsername': (h.get('inviteLinks', {}).get(t) and next((x.get('username') for x in db['users'] if x['id'] == h.get('inviteLinks', {}).get(t)), None))}
-                    for t in h.get('inviteTokens', [])
-                ]
-            }, 200)
+        token = self._get_auth_token()
+        if not token:
+            return {'error': 'missing token'}, 401
+        user = get_user_by_token(db, token)
+        if not user:
+            return {'error': 'invalid token'}, 401
+        if not user.get('isAdmin'):
+            return {'error': 'only admin can manage invites'}, 403
+        h = get_household(db, user['householdId'])
+        new_token = secrets.token_hex(16)
+        h.setdefault('inviteTokens', []).append(new_token)
+        h.setdefault('inviteLinks', {})
+        mark_dirty(db)
+        return {
+            'inviteToken': new_token,
+            'inviteTokens': [
+                {'token': t, 'linkedUsername': _linked_username(db, h, t)}
+                for t in h.get('inviteTokens', [])
+            ]
+        }, 200
+
+    def _api_invite_reset(self, db, parsed):
         # Reset invite tokens (revoke all and generate a single new link)
-        if path == '/api/invite/reset' and self.command == 'POST':
-            token = self._get_auth_token()
-            if not token:
-                return self._send_json({'error': 'missing token'}, 401)
-            user = get_user_by_token(db, token)
-            if not user:
-                return self._send_json({'error': 'invalid token'}, 401)
-            if not user.get('isAdmin'):
-                return self._send_json({'error': 'only admin can reset invites'}, 403)
-            h = get_household(db, user['householdId'])
-            new_token = uuid.uuid4().hex
-            h['inviteTokens'] = [new_token]
-            h['inviteLinks'] = {}
-            save_db(db)
-            return self._send_json({
-                'inviteToken': new_token,
-                'inviteTokens': [{'token': new_token, 'linkedUsername': None}]
-            }, 200)
+        token = self._get_auth_token()
+        if not token:
+            return {'error': 'missing token'}, 401
+        user = get_user_by_token(db, token)
+        if not user:
+            return {'error': 'invalid token'}, 401
+        if not user.get('isAdmin'):
+            return {'error': 'only admin can reset invites'}, 403
+        h = get_household(db, user['householdId'])
+        new_token = secrets.token_hex(16)
+        h['inviteTokens'] = [new_token]
+        h['inviteLinks'] = {}
+        mark_dirty(db)
+        return {
+            'inviteToken': new_token,
+            'inviteTokens': [{'token': new_token, 'linkedUsername': None}]
+        }, 200
+
+    def _api_scores(self, db, parsed):
         # Fetch scoreboard only
-        if path == '/api/scores' and self.command == 'GET':
-            token = self._get_auth_token()
-            if not token:
-                return self._send_json({'error': 'missing token'}, 401)
-            user = get_user_by_token(db, token)
-            if not user:
-                return self._send_json({'error': 'invalid token'}, 401)
-            scoreboard, family_total, family_weekly_total = compute_scoreboard(db, user['householdId'])
-            return self._send_json({
-                'scoreboard': scoreboard,
-                'familyTotal': family_total,
-                'familyWeeklyTotal': family_weekly_total
-            }, 200)
+        token = self._get_auth_token()
+        if not token:
+            return {'error': 'missing token'}, 401
+        user = get_user_by_token(db, token)
+        if not user:
+            return {'error': 'invalid token'}, 401
+        return get_scores_body(db, user['householdId']), 200
+
+    def _api_history(self, db, parsed):
         # Events for a specific day (calendar view)
-        if path == '/api/history' and self.command == 'GET':
-            token = self._get_auth_token()
-            if not token:
-                return self._send_json({'error': 'missing token'}, 401)
-            user = get_user_by_token(db, token)
-            if not user:
-                return self._send_json({'error': 'invalid token'}, 401)
-            query = parse_qs(parsed.query)
-            date_str = (query.get('date') or [None])[0]
-            if date_str:
-                try:
-                    target_date = datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
-                except ValueError:
-                    return self._send_json({'error': 'invalid date'}, 400)
-            else:
-                target_date = _start_of_today().date()
-            users_by_id = {u['id']: u for u in db['users']}
+        token = self._get_auth_token()
+        if not token:
+            return {'error': 'missing token'}, 401
+        user = get_user_by_token(db, token)
+        if not user:
+            return {'error': 'invalid token'}, 401
+        query = parse_qs(parsed.query)
+        date_str = (query.get('date') or [None])[0]
+        if date_str:
+            try:
+                target_date = datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
+            except ValueError:
+                return {'error': 'invalid date'}, 400
+            day = _date_to_day_index(target_date)
+        else:
+            day = _current_day()
+            target_date = datetime.date.fromordinal(day + _EPOCH_ORDINAL)
+        def build_history():
             events = []
-            matched = 0
-            for ev in db.get('events', []):
-                # Robust household check: use get() and compare as strings to avoid
-                # mismatches from different types or missing fields.
-                if str(ev.get('householdId')) != str(user.get('householdId')):
-                    continue
-                if _event_date(ev.get('timestamp', 0)) != target_date:
-                    continue
-                uinfo = users_by_id.get(ev.get('userId'))
+            for ev in get_household_events_on(db, user.get('householdId'), day):
+                uinfo = get_user_by_id(db, ev.get('userId'))
                 events.append({
                     'id': ev.get('id'),
                     'type': ev.get('type'),
@@ -681,244 +1511,290 @@ class AppHandler(SimpleHTTPRequestHandler):
                     'userId': ev.get('userId'),
                     'username': uinfo.get('username') if uinfo else None
                 })
-                matched += 1
-            logger.debug(f"/api/history: matched {matched} events for household {user.get('householdId')}")
-            events.sort(key=lambda e: e['timestamp'])
-            return self._send_json({
+            logger.debug(f"/api/history: matched {len(events)} events for household {user.get('householdId')}")
+            return {
                 'date': target_date.isoformat(),
                 'events': events
-            }, 200)
+            }
+
+        return _cached_body(db, user['householdId'], ('history', day), build_history), 200
+
+    def _api_today(self, db, parsed):
         # Today's events and schedule status for the household
-        if path == '/api/today' and self.command == 'GET':
-            token = self._get_auth_token()
-            if not token:
-                logger.warning("GET /api/today - Missing token")
-                return self._send_json({'error': 'missing token'}, 401)
-            user = get_user_by_token(db, token)
-            if not user:
-                logger.warning("GET /api/today - Invalid token")
-                return self._send_json({'error': 'invalid token'}, 401)
-            logger.info(f"GET /api/today - User: {user['username']}")
-            today = _start_of_today().date()
-            # index users for name lookup
-            users_by_id = {u['id']: u for u in db['users']}
-            events = []
-            matched = 0
-            for ev in db.get('events', []):
-                # Robust household check and tolerant field access
-                if str(ev.get('householdId')) != str(user.get('householdId')):
-                    continue
-                # only events from *today* in local time
-                if _event_date(ev.get('timestamp', 0)) != today:
-                    continue
-                uinfo = users_by_id.get(ev.get('userId'))
-                events.append({
-                    'id': ev.get('id'),
-                    'type': ev.get('type'),
-                    'timestamp': ev.get('timestamp'),
-                    'userId': ev.get('userId'),
-                    'username': uinfo.get('username') if uinfo else None
-                })
-                matched += 1
-            logger.debug(f"/api/today: matched {matched} events for household {user.get('householdId')}")
-            # basic schedule flags
-            has_morning_feed = any(e['type'] == 'feed_morning' for e in events)
-            has_evening_feed = any(e['type'] == 'feed_evening' for e in events)
-            has_walk = any(e['type'] == 'walk' or e['type'].startswith('walk_') for e in events)
-            has_pee = any(e['type'] == 'pee' for e in events)
-            has_poop = any(e['type'] == 'poop' for e in events)
-
-            # additional walk-specific flags and feed timestamps for client scheduling
-            # Map generic 'walk' events to time-of-day buckets using the event timestamp
-            has_walk_morning = False
-            has_walk_afternoon = False
-            has_walk_evening = False
-            for e in events:
-                t = e['type']
-                if t == 'walk_morning':
-                    has_walk_morning = True
-                elif t == 'walk_afternoon':
-                    has_walk_afternoon = True
-                elif t == 'walk_evening':
-                    has_walk_evening = True
-                elif t == 'walk':
-                    # categorize by timestamp hour (local time)
-                    try:
-                        ev_dt = datetime.datetime.fromtimestamp(e['timestamp'])
-                        hour = ev_dt.hour
-                        if 4 <= hour < 12:
-                            has_walk_morning = True
-                        elif 12 <= hour < 18:
-                            has_walk_afternoon = True
-                        else:
-                            has_walk_evening = True
-                    except Exception:
-                        # Fallback: treat as generic walk
+        token = self._get_auth_token()
+        if not token:
+            logger.warning("GET /api/today - Missing token")
+            return {'error': 'missing token'}, 401
+        user = get_user_by_token(db, token)
+        if not user:
+            logger.warning("GET /api/today - Invalid token")
+            return {'error': 'invalid token'}, 401
+        logger.info(f"GET /api/today - User: {user['username']}")
+        today = _current_day()
+        events = []
+        matched = 0
+        # only events from *today* in local time
+        for ev in get_household_events_on(db, user.get('householdId'), today):
+            uinfo = get_user_by_id(db, ev.get('userId'))
+            events.append({
+                'id': ev.get('id'),
+                'type': ev.get('type'),
+                'timestamp': ev.get('timestamp'),
+                'userId': ev.get('userId'),
+                'username': uinfo.get('username') if uinfo else None
+            })
+            matched += 1
+        logger.debug(f"/api/today: matched {matched} events for household {user.get('householdId')}")
+        # basic schedule flags
+        has_morning_feed = any(e['type'] == 'feed_morning' for e in events)
+        has_evening_feed = any(e['type'] == 'feed_evening' for e in events)
+        has_walk = any(e['type'] == 'walk' or e['type'].startswith('walk_') for e in events)
+        has_pee = any(e['type'] == 'pee' for e in events)
+        has_poop = any(e['type'] == 'poop' for e in events)
+
+        # additional walk-specific flags and feed timestamps for client scheduling
+        # Map generic 'walk' events to time-of-day buckets using the event timestamp
+        has_walk_morning = False
+        has_walk_afternoon = False
+        has_walk_evening = False
+        for e in events:
+            t = e['type']
+            if t == 'walk_morning':
+                has_walk_morning = True
+            elif t == 'walk_afternoon':
+                has_walk_afternoon = True
+            elif t == 'walk_evening':
+                has_walk_evening = True
+            elif t == 'walk':
+                # categorize by timestamp hour (local time)
+                try:
+                    ev_dt = datetime.datetime.fromtimestamp(e['timestamp'])
+                    hour = ev_dt.hour
+                    if 4 <= hour < 12:
+                        has_walk_morning = True
+                    elif 12 <= hour < 18:
+                        has_walk_afternoon = True
+                    else:
                         has_walk_evening = True
-            # find first feed timestamps if present
-            feed_morning_ts = next((e['timestamp'] for e in events if e['type'] == 'feed_morning'), None)
-            feed_evening_ts = next((e['timestamp'] for e in events if e['type'] == 'feed_evening'), None)
-
-            # simple daily challenge for the current user: 3 potty events (pee/poop)
-            potty_events = [
-                e for e in events
-                if e['userId'] == user['id'] and e['type'] in ('pee', 'poop')
-            ]
-            challenge_progress = len(potty_events)
-            challenge_target = 3
-            daily_challenge = {
-                'id': 'potty_hero',
-                'title': 'בצעו 3 פעמים פיפי/קקי היום',
-                'target': challenge_target,
-                'progress': challenge_progress,
-                'completed': challenge_progress >= challenge_target,
-            }
+                except Exception:
+                    # Fallback: treat as generic walk
+                    has_walk_evening = True
+        # find first feed timestamps if present
+        feed_morning_ts = next((e['timestamp'] for e in events if e['type'] == 'feed_morning'), None)
+        feed_evening_ts = next((e['timestamp'] for e in events if e['type'] == 'feed_evening'), None)
+
+        # simple daily challenge for the current user: 3 potty events (pee/poop)
+        potty_events = [
+            e for e in events
+            if e['userId'] == user['id'] and e['type'] in ('pee', 'poop')
+        ]
+        challenge_progress = len(potty_events)
+        challenge_target = 3
+        daily_challenge = {
+            'id': 'potty_hero',
+            'title': 'בצעו 3 פעמים פיפי/קקי היום',
+            'target': challenge_target,
+            'progress': challenge_progress,
+            'completed': challenge_progress >= challenge_target,
+        }
 
-            logger.info(f"Returning {len(events)} events for today")
-            return self._send_json({
-                'events': events,
-                'schedule': {
-                    'hasMorningFeed': has_morning_feed,
-                    'hasEveningFeed': has_evening_feed,
-                    'hasWalk': has_walk,
-                    'hasPee': has_pee,
-                    'hasPoop': has_poop,
-                    'hasWalkMorning': has_walk_morning,
-                    'hasWalkAfternoon': has_walk_afternoon,
-                    'hasWalkEvening': has_walk_evening,
-                    'feedMorningTs': feed_morning_ts,
-                    'feedEveningTs': feed_evening_ts
-                },
-                'dailyChallenge': daily_challenge
-            }, 200)
+        logger.info(f"Returning {len(events)} events for today")
+        return {
+            'events': events,
+            'schedule': {
+                'hasMorningFeed': has_morning_feed,
+                'hasEveningFeed': has_evening_feed,
+                'hasWalk': has_walk,
+                'hasPee': has_pee,
+                'hasPoop': has_poop,
+                'hasWalkMorning': has_walk_morning,
+                'hasWalkAfternoon': has_walk_afternoon,
+                'hasWalkEvening': has_walk_evening,
+                'feedMorningTs': feed_morning_ts,
+                'feedEveningTs': feed_evening_ts
+            },
+            'dailyChallenge': daily_challenge
+        }, 200
+
+    def _api_delete_event(self, db, parsed):
         # Delete single event (admin or event owner)
-        if path.startswith('/api/events/') and self.command == 'DELETE':
-            token = self._get_auth_token()
-            if not token:
-                return self._send_json({'error': 'missing token'}, 401)
-            user = get_user_by_token(db, token)
-            if not user:
-                return self._send_json({'error': 'invalid token'}, 401)
-            event_id = path.split('/')[-1]
-            event = next((e for e in db['events'] if e['id'] == event_id), None)
-            if not event:
-                return self._send_json({'error': 'event not found'}, 404)
-            # Only admin or event owner can delete
-            if not user.get('isAdmin') and event['userId'] != user['id']:
-                return self._send_json({'error': 'permission denied'}, 403)
-            db['events'] = [e for e in db['events'] if e['id'] != event_id]
-            save_db(db)
-            logger.info(f"Event {event_id} deleted by {user['username']}")
-            scoreboard, family_total, family_weekly_total = compute_scoreboard(db, user['householdId'])
-            return self._send_json({
-                'success': True,
-                'scoreboard': scoreboard,
-                'familyTotal': family_total,
-                'familyWeeklyTotal': family_weekly_total
-            }, 200)
+        path = parsed.path
+        token = self._get_auth_token()
+        if not token:
+            return {'error': 'missing token'}, 401
+        user = get_user_by_token(db, token)
+        if not user:
+            return {'error': 'invalid token'}, 401
+        event_id = path.split('/')[-1]
+        event = get_household_event(db, user['householdId'], event_id)
+        if not event:
+            return {'error': 'event not found'}, 404
+        # Only admin or event owner can delete
+        if not user.get('isAdmin') and event['userId'] != user['id']:
+            return {'error': 'permission denied'}, 403
+        remove_event(db, event)
+        logger.info(f"Event {event_id} deleted by {user['username']}")
+        scoreboard, family_total, family_weekly_total = compute_scoreboard(db, user['householdId'])
+        return {
+            'success': True,
+            'scoreboard': scoreboard,
+            'familyTotal': family_total,
+            'familyWeeklyTotal': family_weekly_total
+        }, 200
+
+    def _api_admin_reset_scores(self, db, parsed):
         # Reset all scores (admin only) - clears all events
-        if path == '/api/admin/reset-scores' and self.command == 'POST':
-            token = self._get_auth_token()
-            if not token:
-                return self._send_json({'error': 'missing token'}, 401)
-            user = get_user_by_token(db, token)
-            if not user:
-                return self._send_json({'error': 'invalid token'}, 401)
-            if not user.get('isAdmin'):
-                return self._send_json({'error': 'admin only'}, 403)
-            # Delete all events for this household
-            household_id = user['householdId']
-            db['events'] = [e for e in db['events'] if e['householdId'] != household_id]
-            save_db(db)
-            logger.info(f"All scores reset by admin {user['username']} for household {household_id}")
-            return self._send_json({'success': True, 'message': 'כל הנקודות אופסו'}, 200)
+        token = self._get_auth_token()
+        if not token:
+            return {'error': 'missing token'}, 401
+        user = get_user_by_token(db, token)
+        if not user:
+            return {'error': 'invalid token'}, 401
+        if not user.get('isAdmin'):
+            return {'error': 'admin only'}, 403
+        # Delete all events for this household
+        household_id = user['householdId']
+        clear_household_events(db, household_id)
+        logger.info(f"All scores reset by admin {user['username']} for household {household_id}")
+        return {'success': True, 'message': 'כל הנקודות אופסו'}, 200
+
+    def _api_admin_clear_events(self, db, parsed):
         # Clear all events (admin only)
-        if path == '/api/admin/clear-events' and self.command == 'POST':
-            token = self._get_auth_token()
-            if not token:
-                return self._send_json({'error': 'missing token'}, 401)
-            user = get_user_by_token(db, token)
-            if not user:
-                return self._send_json({'error': 'invalid token'}, 401)
-            if not user.get('isAdmin'):
-                return self._send_json({'error': 'admin only'}, 403)
-            # Delete all events for this household
-            household_id = user['householdId']
-            initial_count = len([e for e in db['events'] if e['householdId'] == household_id])
-            db['events'] = [e for e in db['events'] if e['householdId'] != household_id]
-            save_db(db)
-            logger.info(f"All {initial_count} events cleared by admin {user['username']} for household {household_id}")
-            return self._send_json({'success': True, 'message': f'{initial_count} אירועים נמחקו'}, 200)
-        # Unknown API path
-        return self._send_json({'error': 'unknown endpoint'}, 404)
+        token = self._get_auth_token()
+        if not token:
+            return {'error': 'missing token'}, 401
+        user = get_user_by_token(db, token)
+        if not user:
+            return {'error': 'invalid token'}, 401
+        if not user.get('isAdmin'):
+            return {'error': 'admin only'}, 403
+        # Delete all events for this household
+        household_id = user['householdId']
+        initial_count = clear_household_events(db, household_id)
+        logger.info(f"All {initial_count} events cleared by admin {user['username']} for household {household_id}")
+        return {'success': True, 'message': f'{initial_count} אירועים נמחקו'}, 200
 
     def do_GET(self):
-        parsed = urlparse(self.path)
-        if parsed.path.startswith('/api/'):
+        # the full urlparse happens in _route_api, for API requests only
+        if self.path.startswith('/api/'):
             return self._handle_api()
         # Serve static files from the client directory
-        # Determine requested path relative to client directory
-        rel_path = parsed.path.lstrip('/') or 'index.html'
-        abs_path = os.path.join(CLIENT_DIR, rel_path)
-        # prevent directory traversal
-        abs_path = os.path.normpath(abs_path)
-        if not abs_path.startswith(os.path.abspath(CLIENT_DIR)):
-            self.send_response(403)
-            self.end_headers()
-            return
-        if os.path.isdir(abs_path):
-            abs_path = os.path.join(abs_path, 'index.html')
-        if not os.path.exists(abs_path):
-            self.send_response(404)
+        resolved = _static_path(self.path.partition('?')[0])
+        if resolved is None:
+            return self._send_empty(403)
+        abs_path, ext = resolved
+        entry = get_static_file(abs_path)
+        if entry is None:
+            return self._send_empty(404)
+        mtime_ns, body, gz, etag, last_modified, size = entry
+        if ext in _STATIC_REVALIDATE_EXTS:
+            # revalidate on every load (answered with a 304 below) so a
+            # deploy shows up immediately
+            cache_control = 'no-cache'
+        else:
+            cache_control = 'max-age=3600'
+        # If-None-Match takes precedence; If-Modified-Since only counts without it
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match:
+            not_modified = if_none_match.strip() == '*' or etag in if_none_match
+        else:
+            not_modified = _not_modified_since(self.headers.get('If-Modified-Since'), mtime_ns)
+        if not_modified:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', last_modified)
+            self.send_header('Cache-Control', cache_control)
+            self.send_header('Content-Length', '0')
             self.end_headers()
             return
         # serve file
         self.send_response(200)
-        # Determine content type based on extension
-        ext = os.path.splitext(abs_path)[1].lower()
-        content_types = {
-            '.html': 'text/html; charset=utf-8',
-            '.css': 'text/css; charset=utf-8',
-            '.js': 'application/javascript; charset=utf-8',
-            '.png': 'image/png',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.gif': 'image/gif',
-            '.svg': 'image/svg+xml',
-            '.ico': 'image/x-icon'
-        }
-        ctype = content_types.get(ext, 'application/octet-stream')
-        self.send_header('Content-Type', ctype)
-        # allow caching static files
-        if ext in ['.html', '.css', '.js']:
-            self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
+        self.send_header('Content-Type', _STATIC_CONTENT_TYPES.get(ext, 'application/octet-stream'))
+        self.send_header('Cache-Control', cache_control)
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', last_modified)
+        if gz is not None:
+            self.send_header('Vary', 'Accept-Encoding')
+            if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                body = gz
+                self.send_header('Content-Encoding', 'gzip')
+        if body is None:
+            self.send_header('Content-Length', str(size))
+            self.end_headers()
+            return self._send_file(abs_path, size)
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        with open(abs_path, 'rb') as fh:
-            self.wfile.write(fh.read())
+        self.wfile.write(body)
+
+    def _send_file(self, abs_path, size):
+        """Write ``size`` bytes of a file to the socket without copying them
+        through Python (falls back to a plain copy where sendfile fails)."""
+        self.wfile.flush()
+        offset = 0
+        try:
+            with open(abs_path, 'rb') as fh:
+                try:
+                    while offset < size:
+                        sent = os.sendfile(self.connection.fileno(), fh.fileno(), offset, size - offset)
+                        if not sent:
+                            break
+                        offset += sent
+                except (BrokenPipeError, ConnectionResetError):
+                    raise
+                except (AttributeError, OSError):
+                    fh.seek(offset)
+                    shutil.copyfileobj(fh, self.wfile)
+                    offset = size
+        except (BrokenPipeError, ConnectionResetError) as e:
+            logger.warning(f"Client disconnected during file send: {e}")
+            self.close_connection = True
+        if offset < size:
+            # the file shrank after its headers went out
+            self.close_connection = True
 
     def do_POST(self):
-        parsed = urlparse(self.path)
-        if parsed.path.startswith('/api/'):
+        if self.path.startswith('/api/'):
             return self._handle_api()
         else:
             # unsupported
-            self.send_response(405)
-            self.end_headers()
+            self.close_connection = True
+            self._send_empty(405)
 
     def do_DELETE(self):
-        parsed = urlparse(self.path)
-        if parsed.path.startswith('/api/'):
+        if self.path.startswith('/api/'):
             return self._handle_api()
         else:
             # unsupported
-            self.send_response(405)
-            self.end_headers()
+            self.close_connection = True
+            self._send_empty(405)
+
+
+# (method, path) -> AppHandler method serving it
+_API_ROUTES = {
+    ('POST', '/api/register'): AppHandler._api_register,
+    ('POST', '/api/login'): AppHandler._api_login,
+    ('GET', '/api/user'): AppHandler._api_user,
+    ('POST', '/api/dog'): AppHandler._api_dog,
+    ('POST', '/api/events'): AppHandler._api_add_event,
+    ('POST', '/api/invite'): AppHandler._api_invite,
+    ('POST', '/api/invite/reset'): AppHandler._api_invite_reset,
+    ('GET', '/api/scores'): AppHandler._api_scores,
+    ('GET', '/api/history'): AppHandler._api_history,
+    ('GET', '/api/today'): AppHandler._api_today,
+    ('POST', '/api/admin/reset-scores'): AppHandler._api_admin_reset_scores,
+    ('POST', '/api/admin/clear-events'): AppHandler._api_admin_clear_events,
+}
+# (method, path prefix, handler) for paths carrying an id
+_API_PREFIX_ROUTES = [
+    ('DELETE', '/api/events/', AppHandler._api_delete_event),
+]
 
 
 def run_server(port):
     os.chdir(CLIENT_DIR)  # ensure relative file resolution works
+    preload_static_files()
     server_address = ('', port)
-    httpd = HTTPServer(server_address, AppHandler)
+    httpd = ThreadingHTTPServer(server_address, AppHandler)
     logger.info("=" * 60)
     logger.info(f"🐕 Dog Training App Server Starting")
     logger.info(f"Port: {port}")
@@ -926,6 +1802,8 @@ def run_server(port):
     logger.info(f"Database: {DATA_FILE}")
     logger.info("=" * 60)
     print(f"Serving on port {port}...")
+    # exit normally on SIGTERM so queued saves are flushed at exit
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
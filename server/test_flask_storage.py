@@ -0,0 +1,87 @@
+import json
+
+import flask_server
+
+
+def test_events_log_append_and_replay(flask_empty_db, monkeypatch):
+    db = flask_server.load_db()
+    for i in range(3):
+        ev = {'id': f'e{i}', 'householdId': 'h', 'userId': 'u', 'type': 'pee', 'timestamp': 1000 + i}
+        db['events'].append(ev)
+        flask_server.append_event_record(db, ev)
+    db['events'] = [e for e in db['events'] if e['id'] != 'e1']
+    flask_server.append_event_record(db, {'_del': 'e1'})
+
+    # db.json itself is untouched until compaction
+    with open(flask_empty_db, encoding='utf-8') as fh:
+        assert json.load(fh)['events'] == []
+
+    monkeypatch.setattr(flask_server, '_db_cache', None)
+    reloaded = flask_server.load_db()
+    assert [e['id'] for e in reloaded['events']] == ['e0', 'e2']
+
+
+def test_save_db_folds_events_log(flask_empty_db):
+    db = flask_server.load_db()
+    ev = {'id': 'e0', 'householdId': 'h', 'userId': 'u', 'type': 'poop', 'timestamp': 1000}
+    db['events'].append(ev)
+    flask_server.append_event_record(db, ev)
+    flask_server.save_db(db)
+
+    assert not flask_empty_db.with_name('db.events.ndjson').exists()
+    with open(flask_empty_db, encoding='utf-8') as fh:
+        assert [e['id'] for e in json.load(fh)['events']] == ['e0']
+
+
+def test_load_db_applies_only_new_log_records(flask_empty_db):
+    db = flask_server.load_db()
+    ev = {'id': 'e0', 'householdId': 'h', 'userId': 'u', 'type': 'pee', 'timestamp': 1000}
+    flask_server.add_event(db, ev)
+    flask_server.flush_events_log()
+
+    # Another worker appends an event and deletes ours
+    with open(flask_empty_db.with_name('db.events.ndjson'), 'ab') as fh:
+        fh.write(b'{"id":"e1","householdId":"h","userId":"u","type":"poop","timestamp":1001}\n')
+        fh.write(b'{"_del":"e0","householdId":"h"}\n')
+
+    reloaded = flask_server.load_db()
+    assert reloaded is db
+    assert [e['id'] for e in reloaded['events']] == ['e1']
+    assert [e['id'] for e in flask_server.get_household_events(reloaded, 'h')] == ['e1']
+
+
+def test_flush_events_log_writes_buffered_records(flask_empty_db):
+    db = flask_server.load_db()
+    ev = {'id': 'e0', 'householdId': 'h', 'userId': 'u', 'type': 'pee', 'timestamp': 1000}
+    flask_server.add_event(db, ev)
+    log = flask_empty_db.with_name('db.events.ndjson')
+    flask_server.flush_events_log()
+    assert [json.loads(line)['id'] for line in log.read_text().splitlines()] == ['e0']
+
+
+def test_load_db_flushes_overdue_records_without_writer_thread(flask_empty_db, monkeypatch):
+    # e.g. uWSGI without enable-threads: no background writer (the fixture
+    # doesn't start one either), so only the request path can flush
+    monkeypatch.setattr(flask_server, 'EVENTS_LOG_FLUSH_INTERVAL', 60)
+    db = flask_server.load_db()
+    ev = {'id': 'e0', 'householdId': 'h', 'userId': 'u', 'type': 'pee', 'timestamp': 1000}
+    flask_server.add_event(db, ev)
+    log = flask_empty_db.with_name('db.events.ndjson')
+    assert not log.exists()
+
+    monkeypatch.setattr(flask_server, 'EVENTS_LOG_FLUSH_INTERVAL', 0)
+    flask_server.load_db()
+    assert [json.loads(line)['id'] for line in log.read_text().splitlines()] == ['e0']
+
+
+def test_failed_flush_keeps_records(flask_empty_db):
+    db = flask_server.load_db()
+    ev = {'id': 'e0', 'householdId': 'h', 'userId': 'u', 'type': 'pee', 'timestamp': 1000}
+    flask_server.add_event(db, ev)
+    log = flask_empty_db.with_name('db.events.ndjson')
+    log.mkdir()  # opening a directory for append fails
+    flask_server.flush_events_log()
+    assert flask_server._db_cache is db
+    log.rmdir()
+    flask_server.flush_events_log()
+    assert [json.loads(line)['id'] for line in log.read_text().splitlines()] == ['e0']
@@ -1,4 +1,7 @@
+import json
 import shutil
+import threading
+import urllib.request
 import uuid
 from pathlib import Path
 import importlib
@@ -97,4 +100,32 @@ def test_walk_types_in_scoreboard(server_module):
 
 def test_api_simulation(server_module):
     # Ensure AppHandler is importable
-    assert hasattr(server_module, 'AppHandler')
\ No newline at end of file
+    assert hasattr(server_module, 'AppHandler')
+
+
+def test_today_picks_up_new_events(server_module):
+    # /api/today builds the day buckets; later events must land in them
+    httpd = server_module.ThreadingHTTPServer(('127.0.0.1', 0), server_module.AppHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{httpd.server_address[1]}'
+
+    def call(method, path, body=None, token=None):
+        headers = {'Content-Type': 'application/json'}
+        if token:
+            headers['Authorization'] = 'Bearer ' + token
+        data = json.dumps(body).encode() if body is not None else None
+        req = urllib.request.Request(base + path, data=data, method=method, headers=headers)
+        with urllib.request.urlopen(req) as resp:
+            return json.loads(resp.read())
+
+    try:
+        email = f'today+{uuid.uuid4().hex}@example.com'
+        token = call('POST', '/api/register', {'email': email, 'password': 'p'})['token']
+        assert call('GET', '/api/today', token=token)['events'] == []
+        call('POST', '/api/events', {'type': 'pee'}, token=token)
+        call('POST', '/api/events', {'type': 'poop'}, token=token)
+        events = call('GET', '/api/today', token=token)['events']
+        assert sorted(e['type'] for e in events) == ['pee', 'poop']
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
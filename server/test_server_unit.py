@@ -54,18 +54,82 @@ def test_compute_scoreboard_simple():
     assert any(s['username'] == 'B' and s['totalPoints'] == 2 for s in scoreboard)
 
 
-def test_save_and_load_db_roundtrip(tmp_path, monkeypatch):
+def test_save_and_load_db_roundtrip(tmp_path):
     temp_db = tmp_path / 'db.json'
     data = {'households': [], 'users': [], 'events': []}
     with open(temp_db, 'w', encoding='utf-8') as fh:
         json.dump(data, fh)
-    # monkeypatch DATA_FILE to point to temp file
-    monkeypatch.setattr(server, 'DATA_FILE', str(temp_db))
-    loaded = server.load_db()
+    loaded = server.load_db(str(temp_db))
     assert isinstance(loaded, dict)
     # modify and save
     loaded['users'].append({'id': 'u1', 'username': 'x'})
-    server.save_db(loaded)
+    server.save_db(loaded, str(temp_db))
     # reload and check
-    reloaded = server.load_db()
+    reloaded = server.load_db(str(temp_db))
+    assert reloaded is not loaded
     assert any(u['username'] == 'x' for u in reloaded['users'])
+
+
+def test_events_log_append_and_replay(server_db, monkeypatch):
+    db = server.load_db()
+    for i in range(3):
+        ev = {'id': f'e{i}', 'householdId': 'h', 'userId': 'u', 'type': 'pee', 'timestamp': 1000 + i}
+        db['events'].append(ev)
+        server.append_event_record(db, ev)
+    db['events'] = [e for e in db['events'] if e['id'] != 'e1']
+    server.append_event_record(db, {'_del': 'e1', 'householdId': 'h'})
+
+    # db.json itself is untouched until compaction
+    with open(server_db, encoding='utf-8') as fh:
+        assert json.load(fh)['events'] == []
+
+    monkeypatch.setattr(server, '_db_cache', None)
+    reloaded = server.load_db()
+    assert [e['id'] for e in reloaded['events']] == ['e0', 'e2']
+
+
+def test_load_db_applies_only_new_log_records(server_db):
+    db = server.load_db()
+    server.add_event(db, {'id': 'e0', 'householdId': 'h', 'userId': 'u', 'type': 'pee', 'timestamp': 1000})
+
+    # Another process appends an event and deletes ours
+    with open(server_db.with_name('db.events.ndjson'), 'ab') as fh:
+        fh.write(b'{"id":"e1","householdId":"h","userId":"u","type":"poop","timestamp":1001}\n')
+        fh.write(b'{"_del":"e0","householdId":"h"}\n')
+
+    reloaded = server.load_db()
+    assert reloaded is db
+    assert [e['id'] for e in reloaded['events']] == ['e1']
+    assert [e['id'] for e in server.get_household_events(reloaded, 'h')] == ['e1']
+
+
+def test_mark_dirty_saves_on_flush(server_db, monkeypatch):
+    with open(server_db, 'w', encoding='utf-8') as fh:
+        json.dump({'households': [{'id': 'h', 'dogName': ''}], 'users': [], 'events': []}, fh)
+    monkeypatch.setattr(server, 'SAVE_DELAY', 60)
+    db = server.load_db()
+    server.get_household(db, 'h')['dogName'] = 'Rex'
+    server.mark_dirty(db)
+
+    assert server.load_db() is db
+    with open(server_db, encoding='utf-8') as fh:
+        assert json.load(fh)['households'][0]['dogName'] == ''
+
+    server.flush_db()
+    with open(server_db, encoding='utf-8') as fh:
+        assert json.load(fh)['households'][0]['dogName'] == 'Rex'
+
+
+def test_token_index_follows_saved_users(server_db):
+    db = server.load_db()
+    assert server.get_user_by_token(db, 't1') is None
+
+    db['users'].append({'id': 'u1', 'username': 'alice', 'token': 't1', 'householdId': 'h'})
+    server.save_db(db)
+    assert server.get_user_by_token(db, 't1')['id'] == 'u1'
+
+    db['users'][0]['token'] = 't2'
+    server.mark_dirty(db)
+    assert server.get_user_by_token(db, 't1') is None
+    assert server.get_user_by_token(db, 't2')['id'] == 'u1'
+    server.flush_db()
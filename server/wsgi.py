@@ -10,8 +10,21 @@ project_home = os.path.dirname(os.path.abspath(__file__))
 if project_home not in sys.path:
     sys.path = [project_home] + sys.path
 
-# Change to the project directory
-os.chdir(project_home)
+# flask_server resolves db.json and server.log against this, so the
+# worker's working directory doesn't matter
+os.environ.setdefault('DOG_APP_HOME', project_home)
 
-# Import the Flask application
-from flask_server import app as application
+_app = None
+
+
+def application(environ, start_response):
+    """Import the Flask app on the first request, so loading this file
+    (worker start, test collection) doesn't pay for Flask and the db."""
+    global _app
+    if _app is None:
+        from flask_server import app as _app
+    return _app(environ, start_response)
+
+
+# Alias for servers that look for ``app`` (e.g. ``gunicorn wsgi:app``)
+app = application